@@ -0,0 +1,90 @@
+"""
+In-process TTL cache for blockchain reads.
+Concurrent lookups of the same key share a single in-flight fetch.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 12.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        # Bumped by every invalidate/clear (see generation)
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Read before fetching a value and pass it to set(): the value is
+        then dropped if an invalidation happened while it was fetched, as
+        it may predate the change that caused it.
+        """
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        if self.ttl <= 0:
+            return
+        if generation is not None and generation != self._generation:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._generation += 1
+        self._data.pop(key, None)
+        # Later lookups start a fresh fetch instead of joining this one
+        self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._data.clear()
+        self._inflight.clear()
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for `key`, awaiting `fetch()` on a miss.
+
+        With ttl=0 nothing is stored, but concurrent callers for the same
+        key still share one fetch instead of each issuing their own.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            generation = self._generation
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_fetched(key, t, generation))
+        # shield: one caller being cancelled must not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _on_fetched(self, key: Hashable, task: asyncio.Future, generation: int) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            self.set(key, task.result(), generation)
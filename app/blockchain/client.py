@@ -1,23 +1,74 @@
 """
 Blockchain client configuration and Web3 instance.
 """
-from web3 import Web3
+from web3 import Web3, AsyncWeb3, AsyncHTTPProvider
 from eth_account import Account
+from functools import lru_cache
+from typing import List, Optional
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 # Import settings from config
 from app.config import settings
+from .cache import TTLCache
+from .fees import GasOracle
+from .nonces import NonceManager
+from .receipts import ConfirmationQueue, ReceiptWatcher
+
+
+class BlockchainError(Exception):
+    """Custom exception for blockchain errors (shared by all contract modules)."""
+    pass
+
 
 # Configuration from settings
 BLOCKCHAIN_RPC_URL = settings.BLOCKCHAIN_RPC_URL or "http://127.0.0.1:8545"
+BLOCKCHAIN_WS_URL = settings.BLOCKCHAIN_WS_URL
 PROPERTY_FACTORY_ADDRESS = settings.PROPERTY_FACTORY_ADDRESS
 OWNER_PRIVATE_KEY = settings.OWNER_PRIVATE_KEY  # NEVER LOG THIS
-CHAIN_ID = int(settings.CHAIN_ID) if settings.CHAIN_ID else 1337
+CHAIN_ID = settings.CHAIN_ID
+
+# Per-request timeout (seconds) for HTTP RPC calls
+RPC_REQUEST_TIMEOUT = 10
+
+# Async Web3 for all RPC calls (RPC waits don't block the event loop).
+# eth_chainId is constant, so let the provider cache it instead of the
+# validation middleware fetching it before every eth_call / estimate.
+async_w3 = AsyncWeb3(AsyncHTTPProvider(
+    BLOCKCHAIN_RPC_URL,
+    request_kwargs={'timeout': ClientTimeout(total=RPC_REQUEST_TIMEOUT)},
+    cache_allowed_requests=True,
+    cacheable_requests={"eth_chainId"}
+))
+_async_http_session: Optional[ClientSession] = None
+
+# Shared EIP-1559 fee estimate for all outgoing transactions
+gas_oracle = GasOracle(async_w3)
+
+# Legacy gas price, reused for a few seconds across transactions
+_gas_price_cache = TTLCache(maxsize=1, ttl=settings.GAS_PRICE_CACHE_TTL_SECONDS)
+
+# Locally tracked nonces, seeded once per address from the node
+nonce_manager = NonceManager(async_w3)
+
+# Caps concurrent transaction submissions so bursts don't trip provider rate limits
+rpc_semaphore = asyncio.Semaphore(settings.RPC_MAX_INFLIGHT)
 
-# Initialize Web3
-w3 = Web3(Web3.HTTPProvider(BLOCKCHAIN_RPC_URL))
+# Receipt waits driven by a newHeads subscription (polling if no WS URL)
+receipt_watcher = ReceiptWatcher(
+    BLOCKCHAIN_WS_URL,
+    async_w3,
+    timeout=settings.RECEIPT_TIMEOUT,
+    poll_latency=settings.RECEIPT_POLL_LATENCY,
+    max_poll_latency=settings.RECEIPT_POLL_MAX_LATENCY
+)
+
+# Completion callbacks for transactions submitted without waiting
+confirmation_queue = ConfirmationQueue(receipt_watcher)
 
 # Owner account
 owner_account = None
@@ -162,6 +213,27 @@ REAL_ESTATE_1155_ABI = [
 ]
 
 
+# Contract classes with the ABI parsed once; instances only bind an address
+PropertyFactoryContract = async_w3.eth.contract(abi=PROPERTY_FACTORY_ABI)
+RealEstate1155Contract = async_w3.eth.contract(abi=REAL_ESTATE_1155_ABI)
+
+# PropertyFactory contract, built once since its address is fixed at startup
+_PROPERTY_FACTORY_CONTRACT = None
+if PROPERTY_FACTORY_ADDRESS:
+    try:
+        _PROPERTY_FACTORY_CONTRACT = PropertyFactoryContract(
+            address=Web3.to_checksum_address(PROPERTY_FACTORY_ADDRESS)
+        )
+    except Exception as e:
+        logger.error(f"Failed to create factory contract instance: {e}")
+
+
+@lru_cache(maxsize=1024)
+def _realestate1155_contract(address: str):
+    """Build a RealEstate1155 contract, cached by lowercase address."""
+    return RealEstate1155Contract(address=Web3.to_checksum_address(address))
+
+
 def get_property_factory_contract():
     """
     Get PropertyFactory contract instance.
@@ -171,23 +243,16 @@ def get_property_factory_contract():
     """
     if not PROPERTY_FACTORY_ADDRESS:
         logger.warning("PROPERTY_FACTORY_ADDRESS not set")
-        return None
-    
-    try:
-        contract = w3.eth.contract(
-            address=Web3.to_checksum_address(PROPERTY_FACTORY_ADDRESS),
-            abi=PROPERTY_FACTORY_ABI
-        )
-        return contract
-    except Exception as e:
-        logger.error(f"Failed to create factory contract instance: {e}")
-        return None
+    return _PROPERTY_FACTORY_CONTRACT
 
 
 def get_realestate1155_contract(contract_address: str):
     """
     Get RealEstate1155 contract instance for a specific property.
     
+    Instances are memoized per address, so repeated calls skip the
+    checksum hashing and ABI parsing.
+    
     Args:
         contract_address: Address of the property's contract
         
@@ -199,30 +264,146 @@ def get_realestate1155_contract(contract_address: str):
         return None
     
     try:
-        contract = w3.eth.contract(
-            address=Web3.to_checksum_address(contract_address),
-            abi=REAL_ESTATE_1155_ABI
-        )
-        return contract
+        return _realestate1155_contract(contract_address.lower())
     except Exception as e:
         logger.error(f"Failed to create contract instance for {contract_address}: {e}")
         return None
 
 
+async def get_cached_gas_price() -> int:
+    """Current legacy gas price, fetched at most once per cache TTL."""
+    return await _gas_price_cache.get_or_fetch("gas_price", lambda: async_w3.eth.gas_price)
+
+
+async def get_fee_params() -> dict:
+    """
+    Fee fields for a new transaction.
+    
+    EIP-1559 maxFeePerGas / maxPriorityFeePerGas from the gas oracle when
+    USE_EIP1559 is set, otherwise the cached legacy gasPrice.
+    """
+    if settings.USE_EIP1559:
+        return await gas_oracle.fee_params()
+    return {'gasPrice': await get_cached_gas_price()}
+
+
+async def fetch_tx_params(address: str) -> dict:
+    """
+    Fetch the nonce and fee fields for a new transaction.
+    
+    The nonce is reserved from the local nonce manager and fees come from
+    the shared gas oracle or gas price cache, so usually no RPC is needed.
+    Call nonce_manager.reset(address) if the transaction is not submitted.
+    
+    Args:
+        address: Address that will send the transaction
+        
+    Returns:
+        Dict with nonce plus the fields from get_fee_params()
+    """
+    nonce, fees = await asyncio.gather(
+        nonce_manager.next_nonce(address),
+        get_fee_params()
+    )
+    return {'nonce': nonce, **fees}
+
+
+async def fetch_tx_params_many(address: str, count: int) -> List[dict]:
+    """
+    Like fetch_tx_params, for `count` transactions sent together.
+    
+    The nonces are consecutive and reserved in one step, so no other
+    transaction from `address` can be assigned a nonce between them.
+    Call nonce_manager.reset(address) if they are not all submitted.
+    
+    Args:
+        address: Address that will send the transactions
+        count: Number of transactions
+        
+    Returns:
+        List of `count` dicts as returned by fetch_tx_params, in nonce order
+    """
+    nonces, fees = await asyncio.gather(
+        nonce_manager.next_nonces(address, count),
+        get_fee_params()
+    )
+    return [{'nonce': nonce, **fees} for nonce in nonces]
+
+
+async def open_async_session() -> None:
+    """Attach a pooled keep-alive aiohttp session to async_w3 (call on startup)."""
+    global _async_http_session
+    if _async_http_session is None or _async_http_session.closed:
+        _async_http_session = ClientSession(
+            connector=TCPConnector(limit=64, keepalive_timeout=60)
+        )
+        await async_w3.provider.cache_async_session(_async_http_session)
+
+
+async def close_async_session() -> None:
+    """Close the aiohttp session opened by open_async_session (call on shutdown)."""
+    global _async_http_session
+    if _async_http_session is not None:
+        await _async_http_session.close()
+        _async_http_session = None
+
+
+# Static configuration check, evaluated once at import
+BLOCKCHAIN_CONFIGURED = bool(PROPERTY_FACTORY_ADDRESS and owner_account is not None)
+
+# Node connectivity is re-probed in the background at most this often,
+# whether the last probe found the node up or down
+CONNECTION_CHECK_INTERVAL = 30.0
+_is_connected = False
+_last_connection_check = float("-inf")
+_connection_probe: Optional[asyncio.Task] = None
+
+
+async def refresh_node_connection() -> bool:
+    """Probe the node with async_w3 and update the cached connectivity flag."""
+    global _is_connected, _last_connection_check
+    was_connected = _is_connected
+    _is_connected = await async_w3.is_connected()
+    _last_connection_check = time.monotonic()
+    if was_connected and not _is_connected:
+        logger.warning("Blockchain node at %s is no longer reachable", BLOCKCHAIN_RPC_URL)
+    return _is_connected
+
+
+def _node_connected() -> bool:
+    """
+    Cached node connectivity; never waits on the node.
+    
+    Once the cached result is older than CONNECTION_CHECK_INTERVAL a single
+    background probe refreshes it, and callers get the previous result
+    until it finishes.
+    """
+    global _connection_probe
+    stale = time.monotonic() - _last_connection_check >= CONNECTION_CHECK_INTERVAL
+    if stale and (_connection_probe is None or _connection_probe.done()):
+        try:
+            _connection_probe = asyncio.get_running_loop().create_task(refresh_node_connection())
+        except RuntimeError:
+            # No event loop (e.g. called from a script): keep the cached result
+            pass
+    return _is_connected
+
+
 def is_blockchain_enabled() -> bool:
     """Check if blockchain integration is properly configured."""
-    return bool(PROPERTY_FACTORY_ADDRESS and OWNER_PRIVATE_KEY and w3.is_connected())
+    return BLOCKCHAIN_CONFIGURED and _node_connected()
 
 
-def get_blockchain_status() -> dict:
-    """Get blockchain connection status."""
+async def get_blockchain_status() -> dict:
+    """Get blockchain connection status, probing the node now."""
+    connected = await refresh_node_connection()
     return {
-        "connected": w3.is_connected(),
+        "connected": connected,
         "chain_id": CHAIN_ID,
         "rpc_url": BLOCKCHAIN_RPC_URL,
         "factory_address": PROPERTY_FACTORY_ADDRESS or "Not set",
         "owner_address": owner_account.address if owner_account else "Not set",
         "model": "factory (one contract per property)",
-        "enabled": is_blockchain_enabled()
+        "enabled": BLOCKCHAIN_CONFIGURED and connected
     }
 
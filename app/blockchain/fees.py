@@ -0,0 +1,65 @@
+"""
+EIP-1559 fee estimation for outgoing transactions.
+Fees are derived from eth_feeHistory and reused for a few seconds
+instead of asking the node for a gas price on every transaction.
+"""
+import asyncio
+import logging
+import time
+from statistics import median
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+
+class GasOracle:
+    """Caches maxFeePerGas / maxPriorityFeePerGas, refreshed every `refresh_interval` seconds."""
+
+    def __init__(
+        self,
+        web3,
+        refresh_interval: float = 6.0,
+        block_count: int = 5,
+        reward_percentile: int = 50
+    ):
+        self.web3 = web3
+        self.refresh_interval = refresh_interval
+        self.block_count = block_count
+        self.reward_percentile = reward_percentile
+        self.max_fee = 0
+        self.priority_fee = 0
+        self._updated_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_stale(self) -> bool:
+        return time.monotonic() - self._updated_at >= self.refresh_interval
+
+    async def refresh(self) -> None:
+        """Recompute fees from the last `block_count` blocks."""
+        history = await self.web3.eth.fee_history(
+            self.block_count, 'latest', [self.reward_percentile]
+        )
+        # Last entry is the base fee of the next (pending) block
+        base_fee = int(history['baseFeePerGas'][-1])
+        rewards = [int(r[0]) for r in (history.get('reward') or []) if r]
+        priority_fee = int(median(rewards)) if rewards else 0
+        if not priority_fee:
+            priority_fee = await self.web3.eth.max_priority_fee
+
+        self.priority_fee = priority_fee
+        # Headroom for the base fee doubling before inclusion
+        self.max_fee = 2 * base_fee + priority_fee
+        self._updated_at = time.monotonic()
+        logger.debug("Gas oracle refreshed: max_fee=%s, priority_fee=%s", self.max_fee, self.priority_fee)
+
+    async def fee_params(self) -> Dict[str, int]:
+        """Return EIP-1559 fee fields for a transaction dict."""
+        if self._is_stale():
+            async with self._lock:
+                if self._is_stale():
+                    await self.refresh()
+        return {
+            'maxFeePerGas': self.max_fee,
+            'maxPriorityFeePerGas': self.priority_fee,
+            'type': 2
+        }
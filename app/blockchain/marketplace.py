@@ -3,24 +3,50 @@ Marketplace contract interaction functions.
 On-chain secondary marketplace for trading property tokens with USDC.
 """
 from web3 import Web3
+from eth_abi import encode as abi_encode
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
 from web3.exceptions import ContractLogicError
+from functools import lru_cache
+import asyncio
 import logging
-from typing import Optional, Dict, Any
-from eth_account import Account
+from typing import Optional, Dict, Any, Callable, Awaitable
 
+from app.config import settings
+from .cache import TTLCache
 from .client import (
-    w3,
+    BlockchainError,
+    async_w3,
     owner_account,
     CHAIN_ID,
+    fetch_tx_params_many,
+    nonce_manager,
+    receipt_watcher,
+    confirmation_queue,
+    rpc_semaphore,
     is_blockchain_enabled
 )
+from .wallets import get_account_from_private_key, sign_tx_async
+from .transactions import send_transaction
 
 logger = logging.getLogger(__name__)
 
+# Function selectors for the fixed-signature write calls, so calldata can
+# be encoded directly instead of via build_transaction
+CREATE_ORDER_SELECTOR = Web3.keccak(text="createOrder(address,uint256,uint256,uint256)")[:4]
+BUY_SELECTOR = Web3.keccak(text="buy(uint256,uint256)")[:4]
+CANCEL_ORDER_SELECTOR = Web3.keccak(text="cancelOrder(uint256)")[:4]
 
-class BlockchainError(Exception):
-    """Custom exception for blockchain errors."""
-    pass
+# topic0 of OrderCreated(uint256 indexed orderId, address indexed seller, ...)
+ORDER_CREATED_TOPIC = Web3.keccak(text="OrderCreated(uint256,address,address,uint256,uint256,uint256)")
+
+# Approval calls bundled with createOrder / buy
+SET_APPROVAL_FOR_ALL_SELECTOR = Web3.keccak(text="setApprovalForAll(address,bool)")[:4]
+ERC20_APPROVE_SELECTOR = Web3.keccak(text="approve(address,uint256)")[:4]
+APPROVAL_GAS = 100000
+
+# getOrder results, keyed on (marketplace_address, method, args)
+_view_cache = TTLCache(maxsize=10_000, ttl=settings.VIEW_CACHE_TTL_SECONDS)
 
 
 # Marketplace ABI
@@ -80,14 +106,60 @@ MARKETPLACE_ABI = [
         "outputs": [{"name": "", "type": "uint256"}],
         "stateMutability": "view",
         "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "usdc",
+        "outputs": [{"name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "orderId", "type": "uint256"},
+            {"indexed": True, "name": "seller", "type": "address"},
+            {"indexed": False, "name": "tokenContract", "type": "address"},
+            {"indexed": False, "name": "tokenId", "type": "uint256"},
+            {"indexed": False, "name": "amount", "type": "uint256"},
+            {"indexed": False, "name": "pricePerToken", "type": "uint256"}
+        ],
+        "name": "OrderCreated",
+        "type": "event"
     }
 ]
 
 
+# Contract class with the ABI parsed once; instances only bind an address
+MarketplaceContract = async_w3.eth.contract(abi=MARKETPLACE_ABI)
+
+
+@lru_cache(maxsize=1024)
+def _marketplace_contract(address: str):
+    """Build a Marketplace contract, cached by lowercase address."""
+    return MarketplaceContract(address=Web3.to_checksum_address(address))
+
+
+@lru_cache(maxsize=1024)
+def _tx_template(address: str, gas: int) -> Dict[str, Any]:
+    """
+    Constant fields of a transaction to a marketplace.
+    Shared between calls, so never mutate it; copy and add data/nonce/fees.
+    """
+    return {
+        'to': _marketplace_contract(address).address,
+        'value': 0,
+        'gas': gas,
+        'chainId': CHAIN_ID
+    }
+
+
 def get_marketplace_contract(marketplace_address: str):
     """
     Get Marketplace contract instance.
     
+    Instances are memoized per address.
+    
     Args:
         marketplace_address: Address of the Marketplace contract
         
@@ -99,23 +171,110 @@ def get_marketplace_contract(marketplace_address: str):
         return None
     
     try:
-        contract = w3.eth.contract(
-            address=Web3.to_checksum_address(marketplace_address),
-            abi=MARKETPLACE_ABI
-        )
-        return contract
+        return _marketplace_contract(marketplace_address.lower())
     except Exception as e:
         logger.error(f"Failed to create marketplace contract instance: {e}")
         return None
 
 
+def _create_order_calldata(token_contract: str, amount: int, price_per_token_usdc: int) -> bytes:
+    TOKEN_ID = 1  # Always 1 for our properties
+    return CREATE_ORDER_SELECTOR + abi_encode(
+        ['address', 'uint256', 'uint256', 'uint256'],
+        [token_contract, TOKEN_ID, amount, price_per_token_usdc]
+    )
+
+
+def _approval_tx(token_address: str, selector: bytes, types: list, args: list) -> dict:
+    return {
+        'to': Web3.to_checksum_address(token_address),
+        'value': 0,
+        'gas': APPROVAL_GAS,
+        'chainId': CHAIN_ID,
+        'data': selector + abi_encode(types, args)
+    }
+
+
+def order_id_from_receipt(marketplace_address: str, receipt, tx_hash) -> int:
+    """Order ID from the OrderCreated event in a createOrder receipt."""
+    # Match on emitter + topic0 so other logs (e.g. the token's
+    # TransferSingle) are skipped without attempting to decode them
+    marketplace_address = marketplace_address.lower()
+    for log in receipt['logs']:
+        topics = log['topics']
+        if (
+            len(topics) > 1
+            and topics[0] == ORDER_CREATED_TOPIC
+            and log['address'].lower() == marketplace_address
+        ):
+            return int.from_bytes(topics[1], 'big')
+    raise BlockchainError(f"OrderCreated event not found in tx {tx_hash.hex()}")
+
+
+async def _send_pair_and_wait(account: LocalAccount, first_tx: Dict[str, Any], second_tx: Dict[str, Any]) -> tuple:
+    """
+    Sign two txs from `account` at consecutive nonces, submit them in one
+    JSON-RPC batch and wait for both receipts concurrently.
+    
+    The nonce and fee fields are filled in as in send_transaction; the
+    local nonce counter is resynced if the pair is not accepted.
+    
+    Returns:
+        Tuple of (first_hash, first_receipt, second_hash, second_receipt)
+    """
+    try:
+        first_params, second_params = await fetch_tx_params_many(account.address, 2)
+        signed_first, signed_second = await asyncio.gather(
+            sign_tx_async(account, {**first_tx, **first_params}),
+            sign_tx_async(account, {**second_tx, **second_params})
+        )
+        # Bounded by the shared RPC in-flight limit. web3's batch API
+        # rejects eth_sendRawTransaction, so use the raw provider batch.
+        async with rpc_semaphore:
+            responses = await async_w3.provider.make_batch_request([
+                ('eth_sendRawTransaction', [signed_first.raw_transaction.to_0x_hex()]),
+                ('eth_sendRawTransaction', [signed_second.raw_transaction.to_0x_hex()])
+            ])
+        if not isinstance(responses, list):
+            raise BlockchainError(f"Batch rejected: {responses}")
+        errors = [r['error'] for r in responses if 'error' in r]
+        if errors:
+            raise BlockchainError(f"Send failed: {errors[0]}")
+        first_hash, second_hash = (HexBytes(r['result']) for r in responses)
+    except Exception:
+        nonce_manager.reset(account.address)
+        raise
+    
+    logger.info("Approval + order txs sent: %s, %s", first_hash.hex(), second_hash.hex())
+    
+    first_receipt, second_receipt = await asyncio.gather(
+        receipt_watcher.wait_for_receipt(first_hash),
+        receipt_watcher.wait_for_receipt(second_hash)
+    )
+    return first_hash, first_receipt, second_hash, second_receipt
+
+
+# Completion callback for fire-and-forget submits: on_confirmed(tx_hash, receipt)
+OnConfirmed = Callable[[HexBytes, Any], Awaitable[None]]
+
+
+def _confirm_later(tx_hash, on_confirmed: OnConfirmed, order_id: Optional[int] = None, marketplace_address: str = "") -> None:
+    """Hand a sent tx to the confirmation worker, dropping stale cached order state on success."""
+    async def callback(tx_hash, receipt):
+        if order_id is not None and receipt['status'] == 1:
+            _view_cache.invalidate((marketplace_address.lower(), "getOrder", order_id))
+        await on_confirmed(tx_hash, receipt)
+    confirmation_queue.submit(tx_hash, callback)
+
+
 async def create_marketplace_order_onchain(
     marketplace_address: str,
     seller_private_key: str,
     token_contract: str,
     amount: int,
-    price_per_token_usdc: int  # USDC has 6 decimals
-) -> tuple[str, int]:
+    price_per_token_usdc: int,  # USDC has 6 decimals
+    on_confirmed: Optional[OnConfirmed] = None
+) -> tuple[str, Optional[int]]:
     """
     Create a sell order on the marketplace contract.
     Seller must approve marketplace to transfer their tokens first.
@@ -126,9 +285,13 @@ async def create_marketplace_order_onchain(
         token_contract: RealEstate1155 contract address
         amount: Number of tokens to sell
         price_per_token_usdc: Price per token in USDC (with 6 decimals)
+        on_confirmed: If given, return right after sending and call
+            on_confirmed(tx_hash, receipt) once mined (use
+            order_id_from_receipt to get the order ID)
         
     Returns:
-        Tuple of (transaction_hash, order_id)
+        Tuple of (transaction_hash, order_id); order_id is None when
+        on_confirmed is given
         
     Raises:
         BlockchainError: If transaction fails
@@ -142,53 +305,30 @@ async def create_marketplace_order_onchain(
     
     try:
         # Get seller account
-        seller_account = Account.from_key(seller_private_key)
+        seller_account = get_account_from_private_key(seller_private_key)
         
         # Build transaction
-        TOKEN_ID = 1  # Always 1 for our properties
-        tx = marketplace.functions.createOrder(
-            token_contract,
-            TOKEN_ID,
-            amount,
-            price_per_token_usdc
-        ).build_transaction({
-            'from': seller_account.address,
-            'nonce': w3.eth.get_transaction_count(seller_account.address),
-            'gas': 300000,
-            'gasPrice': w3.eth.gas_price,
-            'chainId': CHAIN_ID
-        })
-        
-        # Sign transaction
-        signed_tx = seller_account.sign_transaction(tx)
-        
-        # Send transaction
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        tx = {
+            **_tx_template(marketplace_address.lower(), 300000),
+            'data': _create_order_calldata(token_contract, amount, price_per_token_usdc)
+        }
+        
+        # Sign and send transaction
+        tx_hash = await send_transaction(seller_account, tx)
         
         logger.info(f"Create order tx sent: {tx_hash.hex()}")
         
-        # Wait for receipt
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        if on_confirmed is not None:
+            _confirm_later(tx_hash, on_confirmed)
+            return tx_hash.hex(), None
+        
+        receipt = await receipt_watcher.wait_for_receipt(tx_hash)
         
         if receipt['status'] != 1:
             raise BlockchainError(f"Transaction failed: {tx_hash.hex()}")
         
-        # Get order ID from logs (OrderCreated event)
-        order_id = None
-        for log in receipt['logs']:
-            try:
-                # Try to decode as OrderCreated event
-                if len(log['topics']) > 0:
-                    # First topic is event signature, second is orderId
-                    if len(log['topics']) >= 2:
-                        order_id = int(log['topics'][1].hex(), 16)
-                        break
-            except:
-                continue
-        
-        if order_id is None:
-            # Fallback: get next order ID - 1
-            order_id = marketplace.functions.nextOrderId().call() - 1
+        # Get order ID from the OrderCreated event
+        order_id = order_id_from_receipt(marketplace_address, receipt, tx_hash)
         
         logger.info(f"✅ Order created on-chain: Order ID {order_id}, tx: {tx_hash.hex()}")
         return tx_hash.hex(), order_id
@@ -201,11 +341,81 @@ async def create_marketplace_order_onchain(
         raise BlockchainError(f"Blockchain error: {str(e)}")
 
 
+async def create_order_with_approval(
+    marketplace_address: str,
+    seller_private_key: str,
+    token_contract: str,
+    amount: int,
+    price_per_token_usdc: int  # USDC has 6 decimals
+) -> tuple[str, int]:
+    """
+    Approve the marketplace for the seller's tokens and create a sell order.
+    
+    Both transactions are signed up front (approval at nonce N, createOrder
+    at N+1), submitted in one JSON-RPC batch and confirmed together.
+    
+    Args:
+        marketplace_address: Marketplace contract address
+        seller_private_key: Seller's private key
+        token_contract: RealEstate1155 contract address
+        amount: Number of tokens to sell
+        price_per_token_usdc: Price per token in USDC (with 6 decimals)
+        
+    Returns:
+        Tuple of (order transaction_hash, order_id)
+        
+    Raises:
+        BlockchainError: If either transaction fails
+    """
+    if not is_blockchain_enabled():
+        raise BlockchainError("Blockchain not configured")
+    
+    marketplace = get_marketplace_contract(marketplace_address)
+    if not marketplace:
+        raise BlockchainError("Marketplace contract not available")
+    
+    try:
+        seller_account = get_account_from_private_key(seller_private_key)
+        
+        approve_tx = _approval_tx(
+            token_contract, SET_APPROVAL_FOR_ALL_SELECTOR,
+            ['address', 'bool'], [marketplace.address, True]
+        )
+        order_tx = {
+            **_tx_template(marketplace_address.lower(), 300000),
+            'data': _create_order_calldata(token_contract, amount, price_per_token_usdc)
+        }
+        
+        approve_hash, approve_receipt, tx_hash, receipt = await _send_pair_and_wait(
+            seller_account,
+            approve_tx,
+            order_tx
+        )
+        
+        if approve_receipt['status'] != 1:
+            raise BlockchainError(f"Approval failed: {approve_hash.hex()}")
+        if receipt['status'] != 1:
+            raise BlockchainError(f"Transaction failed: {tx_hash.hex()}")
+        
+        order_id = order_id_from_receipt(marketplace_address, receipt, tx_hash)
+        
+        logger.info("✅ Order created on-chain with approval: Order ID %s, tx: %s", order_id, tx_hash.hex())
+        return tx_hash.hex(), order_id
+        
+    except ContractLogicError as e:
+        logger.error("Contract logic error creating order with approval: %s", e)
+        raise BlockchainError(f"Contract error: {str(e)}")
+    except Exception as e:
+        logger.error("Error creating order with approval: %s", e)
+        raise BlockchainError(f"Blockchain error: {str(e)}")
+
+
 async def buy_from_marketplace_onchain(
     marketplace_address: str,
     buyer_private_key: str,
     order_id: int,
-    amount: int
+    amount: int,
+    on_confirmed: Optional[OnConfirmed] = None
 ) -> str:
     """
     Buy tokens from a marketplace order using USDC.
@@ -216,6 +426,8 @@ async def buy_from_marketplace_onchain(
         buyer_private_key: Buyer's private key
         order_id: Order ID to buy from
         amount: Number of tokens to buy
+        on_confirmed: If given, return right after sending and call
+            on_confirmed(tx_hash, receipt) once mined
         
     Returns:
         Transaction hash as hex string
@@ -232,34 +444,29 @@ async def buy_from_marketplace_onchain(
     
     try:
         # Get buyer account
-        buyer_account = Account.from_key(buyer_private_key)
+        buyer_account = get_account_from_private_key(buyer_private_key)
         
         # Build transaction
-        tx = marketplace.functions.buy(
-            order_id,
-            amount
-        ).build_transaction({
-            'from': buyer_account.address,
-            'nonce': w3.eth.get_transaction_count(buyer_account.address),
-            'gas': 300000,
-            'gasPrice': w3.eth.gas_price,
-            'chainId': CHAIN_ID
-        })
-        
-        # Sign transaction
-        signed_tx = buyer_account.sign_transaction(tx)
-        
-        # Send transaction
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        tx = {
+            **_tx_template(marketplace_address.lower(), 300000),
+            'data': BUY_SELECTOR + abi_encode(['uint256', 'uint256'], [order_id, amount])
+        }
+        
+        # Sign and send transaction
+        tx_hash = await send_transaction(buyer_account, tx)
         
         logger.info(f"Buy from order {order_id} tx sent: {tx_hash.hex()}")
         
-        # Wait for receipt
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        if on_confirmed is not None:
+            _confirm_later(tx_hash, on_confirmed, order_id, marketplace_address)
+            return tx_hash.hex()
+        
+        receipt = await receipt_watcher.wait_for_receipt(tx_hash)
         
         if receipt['status'] != 1:
             raise BlockchainError(f"Transaction failed: {tx_hash.hex()}")
         
+        _view_cache.invalidate((marketplace_address.lower(), "getOrder", order_id))
         logger.info(f"✅ Bought {amount} tokens from order {order_id}: {tx_hash.hex()}")
         return tx_hash.hex()
         
@@ -271,10 +478,87 @@ async def buy_from_marketplace_onchain(
         raise BlockchainError(f"Blockchain error: {str(e)}")
 
 
+async def buy_with_usdc_approval(
+    marketplace_address: str,
+    buyer_private_key: str,
+    order_id: int,
+    amount: int
+) -> str:
+    """
+    Approve the marketplace to spend the buyer's USDC and buy from an order.
+    
+    The USDC approval (for exactly amount * pricePerToken) and the buy are
+    signed at consecutive nonces, submitted in one JSON-RPC batch and
+    confirmed together.
+    
+    Args:
+        marketplace_address: Marketplace contract address
+        buyer_private_key: Buyer's private key
+        order_id: Order ID to buy from
+        amount: Number of tokens to buy
+        
+    Returns:
+        Buy transaction hash as hex string
+        
+    Raises:
+        BlockchainError: If either transaction fails
+    """
+    if not is_blockchain_enabled():
+        raise BlockchainError("Blockchain not configured")
+    
+    marketplace = get_marketplace_contract(marketplace_address)
+    if not marketplace:
+        raise BlockchainError("Marketplace contract not available")
+    
+    order = await get_marketplace_order(marketplace_address, order_id)
+    if not order or not order["is_active"]:
+        raise BlockchainError(f"Order {order_id} not available")
+    
+    try:
+        buyer_account = get_account_from_private_key(buyer_private_key)
+        usdc_address = await _view_cache.get_or_fetch(
+            (marketplace_address.lower(), "usdc"),
+            marketplace.functions.usdc().call
+        )
+        total_cost = amount * order["price_per_token"]
+        
+        approve_tx = _approval_tx(
+            usdc_address, ERC20_APPROVE_SELECTOR,
+            ['address', 'uint256'], [marketplace.address, total_cost]
+        )
+        buy_tx = {
+            **_tx_template(marketplace_address.lower(), 300000),
+            'data': BUY_SELECTOR + abi_encode(['uint256', 'uint256'], [order_id, amount])
+        }
+        
+        approve_hash, approve_receipt, tx_hash, receipt = await _send_pair_and_wait(
+            buyer_account,
+            approve_tx,
+            buy_tx
+        )
+        
+        if approve_receipt['status'] != 1:
+            raise BlockchainError(f"Approval failed: {approve_hash.hex()}")
+        if receipt['status'] != 1:
+            raise BlockchainError(f"Transaction failed: {tx_hash.hex()}")
+        
+        _view_cache.invalidate((marketplace_address.lower(), "getOrder", order_id))
+        logger.info("✅ Bought %s tokens from order %s with approval: %s", amount, order_id, tx_hash.hex())
+        return tx_hash.hex()
+        
+    except ContractLogicError as e:
+        logger.error("Contract logic error buying with approval: %s", e)
+        raise BlockchainError(f"Contract error: {str(e)}")
+    except Exception as e:
+        logger.error("Error buying with approval: %s", e)
+        raise BlockchainError(f"Blockchain error: {str(e)}")
+
+
 async def cancel_marketplace_order_onchain(
     marketplace_address: str,
     seller_private_key: str,
-    order_id: int
+    order_id: int,
+    on_confirmed: Optional[OnConfirmed] = None
 ) -> str:
     """
     Cancel a marketplace order and return tokens to seller.
@@ -283,6 +567,8 @@ async def cancel_marketplace_order_onchain(
         marketplace_address: Marketplace contract address
         seller_private_key: Seller's private key
         order_id: Order ID to cancel
+        on_confirmed: If given, return right after sending and call
+            on_confirmed(tx_hash, receipt) once mined
         
     Returns:
         Transaction hash as hex string
@@ -299,33 +585,29 @@ async def cancel_marketplace_order_onchain(
     
     try:
         # Get seller account
-        seller_account = Account.from_key(seller_private_key)
+        seller_account = get_account_from_private_key(seller_private_key)
         
         # Build transaction
-        tx = marketplace.functions.cancelOrder(
-            order_id
-        ).build_transaction({
-            'from': seller_account.address,
-            'nonce': w3.eth.get_transaction_count(seller_account.address),
-            'gas': 200000,
-            'gasPrice': w3.eth.gas_price,
-            'chainId': CHAIN_ID
-        })
-        
-        # Sign transaction
-        signed_tx = seller_account.sign_transaction(tx)
-        
-        # Send transaction
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        tx = {
+            **_tx_template(marketplace_address.lower(), 200000),
+            'data': CANCEL_ORDER_SELECTOR + abi_encode(['uint256'], [order_id])
+        }
+        
+        # Sign and send transaction
+        tx_hash = await send_transaction(seller_account, tx)
         
         logger.info(f"Cancel order {order_id} tx sent: {tx_hash.hex()}")
         
-        # Wait for receipt
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        if on_confirmed is not None:
+            _confirm_later(tx_hash, on_confirmed, order_id, marketplace_address)
+            return tx_hash.hex()
+        
+        receipt = await receipt_watcher.wait_for_receipt(tx_hash)
         
         if receipt['status'] != 1:
             raise BlockchainError(f"Transaction failed: {tx_hash.hex()}")
         
+        _view_cache.invalidate((marketplace_address.lower(), "getOrder", order_id))
         logger.info(f"✅ Cancelled order {order_id}: {tx_hash.hex()}")
         return tx_hash.hex()
         
@@ -337,7 +619,7 @@ async def cancel_marketplace_order_onchain(
         raise BlockchainError(f"Blockchain error: {str(e)}")
 
 
-def get_marketplace_order(
+async def get_marketplace_order(
     marketplace_address: str,
     order_id: int
 ) -> Optional[Dict[str, Any]]:
@@ -359,7 +641,10 @@ def get_marketplace_order(
         return None
     
     try:
-        order = marketplace.functions.getOrder(order_id).call()
+        order = await _view_cache.get_or_fetch(
+            (marketplace_address.lower(), "getOrder", order_id),
+            marketplace.functions.getOrder(order_id).call
+        )
         
         return {
             "id": int(order[0]),
@@ -0,0 +1,156 @@
+"""
+Multicall3 batched reads.
+Aggregates many contract view calls into a single eth_call, so every
+result comes from the same block.
+"""
+from web3 import Web3
+from eth_abi import decode as abi_decode
+import logging
+from typing import Optional, Dict, Any, List, Tuple
+
+from app.config import settings
+from .client import async_w3, is_blockchain_enabled
+
+logger = logging.getLogger(__name__)
+
+# RealEstate1155 view selectors
+GET_PROPERTY_INFO_SELECTOR = Web3.keccak(text="getPropertyInfo()")[:4]
+TOKENS_MINTED_SELECTOR = Web3.keccak(text="tokensMinted()")[:4]
+TOKENS_AVAILABLE_SELECTOR = Web3.keccak(text="tokensAvailable()")[:4]
+
+# Multicall3 ABI (aggregate3 only)
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+_MULTICALL3_CONTRACT = async_w3.eth.contract(
+    address=Web3.to_checksum_address(settings.MULTICALL3_ADDRESS),
+    abi=MULTICALL3_ABI
+)
+
+
+async def aggregate(calls: List[Tuple[str, bytes]]) -> List[Optional[bytes]]:
+    """
+    Run several view calls in one eth_call through Multicall3.
+    
+    Args:
+        calls: List of (target_address, call_data)
+        
+    Returns:
+        Raw return data per call, or None where the call reverted
+    """
+    if not calls:
+        return []
+    
+    results = await _MULTICALL3_CONTRACT.functions.aggregate3([
+        (Web3.to_checksum_address(target), True, call_data)
+        for target, call_data in calls
+    ]).call()
+    return [bytes(data) if success else None for success, data in results]
+
+
+async def _bulk_read(
+    contract_addresses: List[str],
+    selector: bytes,
+    output_types: List[str]
+) -> List[Optional[tuple]]:
+    """Call one no-argument view on every contract and decode each result."""
+    if not is_blockchain_enabled():
+        logger.warning("Blockchain not configured")
+        return [None] * len(contract_addresses)
+    
+    try:
+        raw_results = await aggregate([(address, selector) for address in contract_addresses])
+    except Exception as e:
+        logger.error("Error in multicall over %s contracts: %s", len(contract_addresses), e)
+        return [None] * len(contract_addresses)
+    
+    decoded = []
+    for address, data in zip(contract_addresses, raw_results):
+        try:
+            decoded.append(abi_decode(output_types, data) if data else None)
+        except Exception as e:
+            logger.error("Error decoding multicall result from contract %s: %s", address, e)
+            decoded.append(None)
+    return decoded
+
+
+async def get_properties_bulk(contract_addresses: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Get property information for many RealEstate1155 contracts at once.
+    
+    Args:
+        contract_addresses: Addresses of the properties' contracts
+        
+    Returns:
+        One dict per address (same shape as get_property_on_chain), or None
+        where the read failed
+    """
+    results = await _bulk_read(
+        contract_addresses,
+        GET_PROPERTY_INFO_SELECTOR,
+        ['uint256', 'uint256', 'uint256', 'bool', 'bool']
+    )
+    return [
+        {
+            "total_tokens": int(info[0]),
+            "tokens_minted": int(info[1]),
+            "price_per_token": int(info[2]),
+            "is_active": bool(info[3]),
+            "is_funded": bool(info[4])
+        } if info is not None else None
+        for info in results
+    ]
+
+
+async def get_tokens_minted_bulk(contract_addresses: List[str]) -> List[Optional[int]]:
+    """
+    Get tokens minted for many RealEstate1155 contracts at once.
+    
+    Args:
+        contract_addresses: Addresses of the properties' contracts
+        
+    Returns:
+        Tokens minted per address, or None where the read failed
+    """
+    results = await _bulk_read(contract_addresses, TOKENS_MINTED_SELECTOR, ['uint256'])
+    return [int(r[0]) if r is not None else None for r in results]
+
+
+async def get_tokens_available_bulk(contract_addresses: List[str]) -> List[Optional[int]]:
+    """
+    Get tokens available for many RealEstate1155 contracts at once.
+    
+    Args:
+        contract_addresses: Addresses of the properties' contracts
+        
+    Returns:
+        Tokens available per address, or None where the read failed
+    """
+    results = await _bulk_read(contract_addresses, TOKENS_AVAILABLE_SELECTOR, ['uint256'])
+    return [int(r[0]) if r is not None else None for r in results]
@@ -0,0 +1,41 @@
+"""
+Local nonce tracking for outgoing transactions.
+Each address is seeded once from the node; later nonces are handed out
+from memory so concurrent submits never reuse one.
+"""
+import asyncio
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class NonceManager:
+    """Hands out sequential nonces per address under a per-address lock."""
+
+    def __init__(self, web3):
+        self.web3 = web3
+        self._next: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def next_nonce(self, address: str) -> int:
+        """Reserve and return the next nonce for `address`."""
+        return (await self.next_nonces(address, 1))[0]
+
+    async def next_nonces(self, address: str, count: int) -> List[int]:
+        """
+        Reserve `count` consecutive nonces for `address` under one lock, so
+        no concurrent reservation can take a nonce in between.
+        """
+        lock = self._locks.setdefault(address, asyncio.Lock())
+        async with lock:
+            if address not in self._next:
+                self._next[address] = await self.web3.eth.get_transaction_count(address, 'pending')
+            first = self._next[address]
+            self._next[address] = first + count
+            return list(range(first, first + count))
+
+    def reset(self, address: str) -> None:
+        """Drop the local counter so the next call resyncs from the node."""
+        if self._next.pop(address, None) is not None:
+            logger.info("Nonce counter reset for %s", address)
@@ -4,24 +4,76 @@ Factory pattern: Each property gets its own RealEstate1155 contract.
 """
 from web3 import Web3
 from web3.exceptions import ContractLogicError
+from eth_abi import encode as abi_encode
+from hexbytes import HexBytes
+import asyncio
 import logging
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 
 from .client import (
-    w3,
+    BlockchainError,
+    async_w3,
     get_property_factory_contract,
     get_realestate1155_contract,
     owner_account,
     CHAIN_ID,
+    rpc_semaphore,
+    receipt_watcher,
+    fetch_tx_params_many,
+    nonce_manager,
     is_blockchain_enabled
 )
+from .wallets import get_account_from_private_key, sign_tx_async
+from .transactions import send_transaction
 
 logger = logging.getLogger(__name__)
 
+# Function selectors for the fixed-signature write calls, so calldata can
+# be encoded directly instead of via build_transaction
+CREATE_PROPERTY_CONTRACT_SELECTOR = Web3.keccak(
+    text="createPropertyContract(uint256,uint256,uint256,string,string,string)"
+)[:4]
+MINT_FOR_TREASURY_SELECTOR = Web3.keccak(text="mintForTreasury(uint256)")[:4]
+MINT_TO_SELECTOR = Web3.keccak(text="mintTo(address,uint256)")[:4]
+BURN_FROM_TREASURY_SELECTOR = Web3.keccak(text="burnFromTreasury(uint256)")[:4]
+SAFE_TRANSFER_FROM_SELECTOR = Web3.keccak(text="safeTransferFrom(address,address,uint256,uint256,bytes)")[:4]
 
-class BlockchainError(Exception):
-    """Custom exception for blockchain errors."""
-    pass
+
+def _build_tx(to: str, gas: int, data: bytes) -> Dict[str, Any]:
+    """Assemble a transaction dict; nonce and fees are added when it is sent."""
+    return {
+        'to': to,
+        'value': 0,
+        'gas': gas,
+        'chainId': CHAIN_ID,
+        'data': data
+    }
+
+
+def _deployment_tx(
+    factory,
+    property_id: int,
+    total_tokens: int,
+    price_per_token: int,
+    base_uri: str,
+    property_name: str,
+    property_symbol: str
+) -> Dict[str, Any]:
+    """Build a factory createPropertyContract tx."""
+    # Default values if not provided
+    if not property_name:
+        property_name = f"Property {property_id}"
+    if not property_symbol:
+        property_symbol = f"PROP{property_id}"
+    if not base_uri:
+        base_uri = f"https://api.example.com/metadata/{property_id}/"
+    
+    data = CREATE_PROPERTY_CONTRACT_SELECTOR + abi_encode(
+        ['uint256', 'uint256', 'uint256', 'string', 'string', 'string'],
+        [property_id, total_tokens, price_per_token, base_uri, property_name, property_symbol]
+    )
+    # Higher gas for contract deployment
+    return _build_tx(factory.address, 3000000, data)
 
 
 async def create_property_contract_via_factory(
@@ -57,72 +109,180 @@ async def create_property_contract_via_factory(
         raise BlockchainError("Factory contract not available")
     
     try:
-        # Default values if not provided
-        if not property_name:
-            property_name = f"Property {property_id}"
-        if not property_symbol:
-            property_symbol = f"PROP{property_id}"
-        if not base_uri:
-            base_uri = f"https://api.example.com/metadata/{property_id}/"
-        
-        # Build transaction
-        tx = factory.functions.createPropertyContract(
-            property_id,
-            total_tokens,
-            price_per_token,
-            base_uri,
-            property_name,
-            property_symbol
-        ).build_transaction({
-            'from': owner_account.address,
-            'nonce': w3.eth.get_transaction_count(owner_account.address),
-            'gas': 3000000,  # Higher gas for contract deployment
-            'gasPrice': w3.eth.gas_price,
-            'chainId': CHAIN_ID
-        })
-        
-        # Sign transaction
-        signed_tx = owner_account.sign_transaction(tx)
-        
-        # Send transaction
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        
-        logger.info(f"Property {property_id} contract deployment tx sent: {tx_hash.hex()}")
-        
-        # Wait for receipt
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=180)
+        # Build and send transaction
+        tx = _deployment_tx(
+            factory, property_id, total_tokens, price_per_token,
+            base_uri, property_name, property_symbol
+        )
+        tx_hash = await send_transaction(owner_account, tx)
+        tx_hash_hex = tx_hash.hex()
+        
+        logger.info("Property %s contract deployment tx sent: %s", property_id, tx_hash_hex)
+        
+        receipt = await receipt_watcher.wait_for_receipt(tx_hash)
         
         if receipt['status'] != 1:
-            raise BlockchainError(f"Transaction failed: {tx_hash.hex()}")
+            raise BlockchainError(f"Transaction failed: {tx_hash_hex}")
         
         # Get contract address from factory mapping
-        contract_address = factory.functions.getPropertyContract(property_id).call()
+        contract_address = await factory.functions.getPropertyContract(property_id).call()
         
-        logger.info(f"Property {property_id} contract deployed at {contract_address}: {tx_hash.hex()}")
-        return tx_hash.hex(), contract_address
+        logger.info("Property %s contract deployed at %s: %s", property_id, contract_address, tx_hash_hex)
+        return tx_hash_hex, contract_address
         
     except ContractLogicError as e:
-        logger.error(f"Contract logic error deploying property {property_id}: {e}")
+        logger.error("Contract logic error deploying property %s: %s", property_id, e)
         raise BlockchainError(f"Contract error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error deploying property {property_id} contract: {e}")
+        logger.error("Error deploying property %s contract: %s", property_id, e)
         raise BlockchainError(f"Blockchain error: {str(e)}")
 
 
-async def mint_for_treasury(
+async def create_many_property_contracts(specs: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """
+    Deploy several RealEstate1155 contracts via the factory concurrently.
+    
+    All transactions are signed at consecutive owner nonces, submitted in
+    one JSON-RPC batch and confirmed together, so K deployments take about
+    one block instead of K.
+    
+    Args:
+        specs: One dict per property with the keyword arguments of
+            create_property_contract_via_factory (property_id and
+            total_tokens required)
+        
+    Returns:
+        List of (transaction_hash, contract_address), in the order of specs
+        
+    Raises:
+        BlockchainError: If any transaction fails
+    """
+    if not is_blockchain_enabled():
+        raise BlockchainError("Blockchain not configured")
+    
+    factory = get_property_factory_contract()
+    if not factory:
+        raise BlockchainError("Factory contract not available")
+    
+    if not specs:
+        return []
+    
+    try:
+        sent = False
+        try:
+            # Consecutive nonces reserved together; only a first use needs an RPC
+            tx_params = await fetch_tx_params_many(owner_account.address, len(specs))
+            txs = [
+                _deployment_tx(
+                    factory,
+                    spec['property_id'],
+                    spec['total_tokens'],
+                    spec.get('price_per_token', 1),
+                    spec.get('base_uri', ""),
+                    spec.get('property_name', ""),
+                    spec.get('property_symbol', "")
+                )
+                for spec in specs
+            ]
+            signed_txs = await asyncio.gather(*(
+                sign_tx_async(owner_account, {**tx, **params})
+                for tx, params in zip(txs, tx_params)
+            ))
+            
+            # web3's batch API rejects eth_sendRawTransaction, so use the raw provider batch
+            async with rpc_semaphore:
+                responses = await async_w3.provider.make_batch_request([
+                    ('eth_sendRawTransaction', [signed_tx.raw_transaction.to_0x_hex()])
+                    for signed_tx in signed_txs
+                ])
+            if not isinstance(responses, list):
+                raise BlockchainError(f"Batch rejected: {responses}")
+            errors = [r['error'] for r in responses if 'error' in r]
+            if errors:
+                raise BlockchainError(f"Send failed: {errors[0]}")
+            tx_hashes = [HexBytes(r['result']) for r in responses]
+            sent = True
+        finally:
+            # Any failure before the batch is accepted (bad spec, encoding,
+            # signing, send) leaves reserved nonces unused
+            if not sent:
+                nonce_manager.reset(owner_account.address)
+        
+        logger.info("%s property contract deployment txs sent", len(tx_hashes))
+        
+        receipts = await asyncio.gather(*(
+            receipt_watcher.wait_for_receipt(tx_hash) for tx_hash in tx_hashes
+        ))
+        
+        for spec, tx_hash, receipt in zip(specs, tx_hashes, receipts):
+            if receipt['status'] != 1:
+                raise BlockchainError(
+                    f"Transaction failed for property {spec['property_id']}: {tx_hash.hex()}"
+                )
+        
+        # Get contract addresses from factory mapping
+        contract_addresses = await asyncio.gather(*(
+            factory.functions.getPropertyContract(spec['property_id']).call()
+            for spec in specs
+        ))
+        
+        logger.info("Deployed %s property contracts", len(specs))
+        return [
+            (tx_hash.hex(), contract_address)
+            for tx_hash, contract_address in zip(tx_hashes, contract_addresses)
+        ]
+        
+    except BlockchainError:
+        raise
+    except ContractLogicError as e:
+        logger.error("Contract logic error deploying properties: %s", e)
+        raise BlockchainError(f"Contract error: {str(e)}")
+    except Exception as e:
+        logger.error("Error deploying property contracts: %s", e)
+        raise BlockchainError(f"Blockchain error: {str(e)}")
+
+
+async def confirm_tx(tx_hash: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Wait for a submitted transaction to be mined.
+    
+    Args:
+        tx_hash: Transaction hash returned by one of the submit_* functions
+        timeout: Seconds to wait before giving up (default RECEIPT_TIMEOUT)
+        
+    Returns:
+        Transaction receipt
+        
+    Raises:
+        BlockchainError: If the transaction reverted or was not mined in time
+    """
+    try:
+        receipt = await receipt_watcher.wait_for_receipt(tx_hash, timeout=timeout)
+    except Exception as e:
+        logger.error("Error waiting for transaction %s: %s", tx_hash, e)
+        raise BlockchainError(f"Blockchain error: {str(e)}")
+    
+    if receipt['status'] != 1:
+        raise BlockchainError(f"Transaction failed: {tx_hash}")
+    
+    return receipt
+
+
+async def submit_mint_for_treasury(
     contract_address: str,
     amount: int
 ) -> str:
     """
     Mint tokens to treasury after user payment.
     Uses the property's specific contract address.
+    Returns right after submission; see confirm_tx().
     
     Args:
         contract_address: Address of the property's RealEstate1155 contract
         amount: Number of tokens to mint
         
     Returns:
-        Transaction hash as hex string
+        Transaction hash as hex string (not yet mined)
         
     Raises:
         BlockchainError: If transaction fails
@@ -139,42 +299,53 @@ async def mint_for_treasury(
     
     try:
         # Build transaction (no propertyId parameter!)
-        tx = contract.functions.mintForTreasury(
-            amount
-        ).build_transaction({
-            'from': owner_account.address,
-            'nonce': w3.eth.get_transaction_count(owner_account.address),
-            'gas': 200000,
-            'gasPrice': w3.eth.gas_price,
-            'chainId': CHAIN_ID
-        })
-        
-        # Sign transaction
-        signed_tx = owner_account.sign_transaction(tx)
-        
-        # Send transaction
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        
-        logger.info(f"Mint {amount} tokens on contract {contract_address} tx sent: {tx_hash.hex()}")
+        tx = _build_tx(
+            contract.address,
+            200000,
+            MINT_FOR_TREASURY_SELECTOR + abi_encode(['uint256'], [amount])
+        )
         
-        # Wait for receipt
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        # Sign and send transaction
+        tx_hash = await send_transaction(owner_account, tx)
+        tx_hash_hex = tx_hash.hex()
         
-        if receipt['status'] != 1:
-            raise BlockchainError(f"Transaction failed: {tx_hash.hex()}")
+        logger.info("Mint %s tokens on contract %s tx sent: %s", amount, contract_address, tx_hash_hex)
         
-        logger.info(f"Minted {amount} tokens on contract {contract_address}: {tx_hash.hex()}")
-        return tx_hash.hex()
+        return tx_hash_hex
         
     except ContractLogicError as e:
-        logger.error(f"Contract logic error minting on {contract_address}: {e}")
+        logger.error("Contract logic error minting on %s: %s", contract_address, e)
         raise BlockchainError(f"Contract error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error minting on contract {contract_address}: {e}")
+        logger.error("Error minting on contract %s: %s", contract_address, e)
         raise BlockchainError(f"Blockchain error: {str(e)}")
 
 
-async def mint_to_user(
+async def mint_for_treasury(
+    contract_address: str,
+    amount: int
+) -> str:
+    """
+    Mint tokens to treasury and wait for the transaction to be mined.
+    
+    Args:
+        contract_address: Address of the property's RealEstate1155 contract
+        amount: Number of tokens to mint
+        
+    Returns:
+        Transaction hash as hex string
+        
+    Raises:
+        BlockchainError: If transaction fails
+    """
+    tx_hash = await submit_mint_for_treasury(contract_address, amount)
+    await confirm_tx(tx_hash)
+    
+    logger.info("Minted %s tokens on contract %s: %s", amount, contract_address, tx_hash)
+    return tx_hash
+
+
+async def submit_mint_to_user(
     contract_address: str,
     to_address: str,
     amount: int
@@ -182,6 +353,7 @@ async def mint_to_user(
     """
     Mint tokens directly to a user's wallet after off-chain payment.
     Uses the property's specific contract address.
+    Returns right after submission; see confirm_tx().
     
     Args:
         contract_address: Address of the property's RealEstate1155 contract
@@ -189,7 +361,7 @@ async def mint_to_user(
         amount: Number of tokens to mint
         
     Returns:
-        Transaction hash as hex string
+        Transaction hash as hex string (not yet mined)
         
     Raises:
         BlockchainError: If transaction fails
@@ -209,56 +381,75 @@ async def mint_to_user(
     
     try:
         # Build transaction for mintTo(to, amount)
-        tx = contract.functions.mintTo(
-            to_address,
-            amount
-        ).build_transaction({
-            'from': owner_account.address,
-            'nonce': w3.eth.get_transaction_count(owner_account.address),
-            'gas': 200000,
-            'gasPrice': w3.eth.gas_price,
-            'chainId': CHAIN_ID
-        })
-        
-        # Sign transaction with platform owner key
-        signed_tx = owner_account.sign_transaction(tx)
-        
-        # Send transaction
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        
-        logger.info(f"Mint {amount} tokens to {to_address} on contract {contract_address} tx sent: {tx_hash.hex()}")
+        tx = _build_tx(
+            contract.address,
+            200000,
+            MINT_TO_SELECTOR + abi_encode(
+                ['address', 'uint256'],
+                [to_address, amount]
+            )
+        )
         
-        # Wait for receipt
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        # Sign and send transaction
+        tx_hash = await send_transaction(owner_account, tx)
+        tx_hash_hex = tx_hash.hex()
         
-        if receipt['status'] != 1:
-            raise BlockchainError(f"Transaction failed: {tx_hash.hex()}")
+        logger.info(
+            "Mint %s tokens to %s on contract %s tx sent: %s",
+            amount, to_address, contract_address, tx_hash_hex
+        )
         
-        logger.info(f"✅ Minted {amount} tokens to {to_address} on contract {contract_address}: {tx_hash.hex()}")
-        return tx_hash.hex()
+        return tx_hash_hex
         
     except ContractLogicError as e:
-        logger.error(f"Contract logic error minting to user on {contract_address}: {e}")
+        logger.error("Contract logic error minting to user on %s: %s", contract_address, e)
         raise BlockchainError(f"Contract error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error minting to user on contract {contract_address}: {e}")
+        logger.error("Error minting to user on contract %s: %s", contract_address, e)
         raise BlockchainError(f"Blockchain error: {str(e)}")
 
 
-async def burn_from_treasury(
+async def mint_to_user(
+    contract_address: str,
+    to_address: str,
+    amount: int
+) -> str:
+    """
+    Mint tokens to a user's wallet and wait for the transaction to be mined.
+    
+    Args:
+        contract_address: Address of the property's RealEstate1155 contract
+        to_address: User's blockchain wallet address
+        amount: Number of tokens to mint
+        
+    Returns:
+        Transaction hash as hex string
+        
+    Raises:
+        BlockchainError: If transaction fails
+    """
+    tx_hash = await submit_mint_to_user(contract_address, to_address, amount)
+    await confirm_tx(tx_hash)
+    
+    logger.info("✅ Minted %s tokens to %s on contract %s: %s", amount, to_address, contract_address, tx_hash)
+    return tx_hash
+
+
+async def submit_burn_from_treasury(
     contract_address: str,
     amount: int
 ) -> str:
     """
     Burn tokens from treasury (for refunds).
     Uses the property's specific contract address.
+    Returns right after submission; see confirm_tx().
     
     Args:
         contract_address: Address of the property's RealEstate1155 contract
         amount: Number of tokens to burn
         
     Returns:
-        Transaction hash as hex string
+        Transaction hash as hex string (not yet mined)
         
     Raises:
         BlockchainError: If transaction fails
@@ -275,42 +466,53 @@ async def burn_from_treasury(
     
     try:
         # Build transaction (no propertyId parameter!)
-        tx = contract.functions.burnFromTreasury(
-            amount
-        ).build_transaction({
-            'from': owner_account.address,
-            'nonce': w3.eth.get_transaction_count(owner_account.address),
-            'gas': 200000,
-            'gasPrice': w3.eth.gas_price,
-            'chainId': CHAIN_ID
-        })
-        
-        # Sign transaction
-        signed_tx = owner_account.sign_transaction(tx)
-        
-        # Send transaction
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        
-        logger.info(f"Burn {amount} tokens on contract {contract_address} tx sent: {tx_hash.hex()}")
+        tx = _build_tx(
+            contract.address,
+            200000,
+            BURN_FROM_TREASURY_SELECTOR + abi_encode(['uint256'], [amount])
+        )
         
-        # Wait for receipt
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        # Sign and send transaction
+        tx_hash = await send_transaction(owner_account, tx)
+        tx_hash_hex = tx_hash.hex()
         
-        if receipt['status'] != 1:
-            raise BlockchainError(f"Transaction failed: {tx_hash.hex()}")
+        logger.info("Burn %s tokens on contract %s tx sent: %s", amount, contract_address, tx_hash_hex)
         
-        logger.info(f"Burned {amount} tokens on contract {contract_address}: {tx_hash.hex()}")
-        return tx_hash.hex()
+        return tx_hash_hex
         
     except ContractLogicError as e:
-        logger.error(f"Contract logic error burning on {contract_address}: {e}")
+        logger.error("Contract logic error burning on %s: %s", contract_address, e)
         raise BlockchainError(f"Contract error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error burning on contract {contract_address}: {e}")
+        logger.error("Error burning on contract %s: %s", contract_address, e)
         raise BlockchainError(f"Blockchain error: {str(e)}")
 
 
-def get_property_on_chain(contract_address: str) -> Optional[Dict[str, Any]]:
+async def burn_from_treasury(
+    contract_address: str,
+    amount: int
+) -> str:
+    """
+    Burn tokens from treasury and wait for the transaction to be mined.
+    
+    Args:
+        contract_address: Address of the property's RealEstate1155 contract
+        amount: Number of tokens to burn
+        
+    Returns:
+        Transaction hash as hex string
+        
+    Raises:
+        BlockchainError: If transaction fails
+    """
+    tx_hash = await submit_burn_from_treasury(contract_address, amount)
+    await confirm_tx(tx_hash)
+    
+    logger.info("Burned %s tokens on contract %s: %s", amount, contract_address, tx_hash)
+    return tx_hash
+
+
+async def get_property_on_chain(contract_address: str) -> Optional[Dict[str, Any]]:
     """
     Get property information from blockchain (view function).
     Uses the property's specific contract address.
@@ -335,7 +537,7 @@ def get_property_on_chain(contract_address: str) -> Optional[Dict[str, Any]]:
     
     try:
         # Get property info (no propertyId parameter!)
-        info = contract.functions.getPropertyInfo().call()
+        info = await contract.functions.getPropertyInfo().call()
         
         return {
             "total_tokens": int(info[0]),
@@ -346,11 +548,11 @@ def get_property_on_chain(contract_address: str) -> Optional[Dict[str, Any]]:
         }
         
     except Exception as e:
-        logger.error(f"Error getting property info from contract {contract_address}: {e}")
+        logger.error("Error getting property info from contract %s: %s", contract_address, e)
         return None
 
 
-def get_tokens_minted(contract_address: str) -> Optional[int]:
+async def get_tokens_minted(contract_address: str) -> Optional[int]:
     """
     Get tokens minted for a property (view function).
     Uses the property's specific contract address.
@@ -372,14 +574,14 @@ def get_tokens_minted(contract_address: str) -> Optional[int]:
         return None
     
     try:
-        minted = contract.functions.tokensMinted().call()
+        minted = await contract.functions.tokensMinted().call()
         return int(minted)
     except Exception as e:
-        logger.error(f"Error getting tokens minted from contract {contract_address}: {e}")
+        logger.error("Error getting tokens minted from contract %s: %s", contract_address, e)
         return None
 
 
-def get_tokens_available(contract_address: str) -> Optional[int]:
+async def get_tokens_available(contract_address: str) -> Optional[int]:
     """
     Get tokens available for a property (view function).
     Uses the property's specific contract address.
@@ -401,10 +603,10 @@ def get_tokens_available(contract_address: str) -> Optional[int]:
         return None
     
     try:
-        available = contract.functions.tokensAvailable().call()
+        available = await contract.functions.tokensAvailable().call()
         return int(available)
     except Exception as e:
-        logger.error(f"Error getting tokens available from contract {contract_address}: {e}")
+        logger.error("Error getting tokens available from contract %s: %s", contract_address, e)
         return None
 
 
@@ -455,7 +657,7 @@ async def transfer_tokens_custodial(
     
     try:
         # Create account from seller's private key
-        from_account = w3.eth.account.from_key(from_private_key)
+        from_account = get_account_from_private_key(from_private_key)
         
         # Verify the account matches the from_address
         if from_account.address.lower() != from_address.lower():
@@ -466,46 +668,44 @@ async def transfer_tokens_custodial(
         TOKEN_ID = 1
         
         # Build transaction - seller executes the transfer
-        tx = contract.functions.safeTransferFrom(
-            from_address,
-            to_address,
-            TOKEN_ID,
-            amount,
-            b''  # empty data
-        ).build_transaction({
-            'from': from_address,
-            'nonce': w3.eth.get_transaction_count(from_address),
-            'gas': 200000,
-            'gasPrice': w3.eth.gas_price,
-            'chainId': CHAIN_ID
-        })
-        
-        # Sign transaction with seller's private key
-        signed_tx = from_account.sign_transaction(tx)
-        
-        # Send transaction
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        tx = _build_tx(
+            contract.address,
+            200000,
+            SAFE_TRANSFER_FROM_SELECTOR + abi_encode(
+                ['address', 'address', 'uint256', 'uint256', 'bytes'],
+                [
+                    from_address,
+                    to_address,
+                    TOKEN_ID,
+                    amount,
+                    b''  # empty data
+                ]
+            )
+        )
+        
+        # Sign and send transaction
+        tx_hash = await send_transaction(from_account, tx)
+        tx_hash_hex = tx_hash.hex()
         
         logger.info(
-            f"Transfer {amount} tokens from {from_address} to {to_address} "
-            f"on contract {contract_address} tx sent: {tx_hash.hex()}"
+            "Transfer %s tokens from %s to %s on contract %s tx sent: %s",
+            amount, from_address, to_address, contract_address, tx_hash_hex
         )
         
-        # Wait for receipt
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        receipt = await receipt_watcher.wait_for_receipt(tx_hash)
         
         if receipt['status'] != 1:
-            raise BlockchainError(f"Transaction failed: {tx_hash.hex()}")
+            raise BlockchainError(f"Transaction failed: {tx_hash_hex}")
         
         logger.info(
-            f"✅ Transferred {amount} tokens from {from_address} to {to_address} "
-            f"on contract {contract_address}: {tx_hash.hex()}"
+            "✅ Transferred %s tokens from %s to %s on contract %s: %s",
+            amount, from_address, to_address, contract_address, tx_hash_hex
         )
-        return tx_hash.hex()
+        return tx_hash_hex
         
     except ContractLogicError as e:
-        logger.error(f"Contract logic error transferring tokens: {e}")
+        logger.error("Contract logic error transferring tokens: %s", e)
         raise BlockchainError(f"Contract error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error transferring tokens: {e}")
+        logger.error("Error transferring tokens: %s", e)
         raise BlockchainError(f"Blockchain error: {str(e)}")
\ No newline at end of file
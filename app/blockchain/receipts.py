@@ -0,0 +1,233 @@
+"""
+Transaction receipt watcher.
+One WebSocket newHeads subscription resolves every in-flight receipt
+instead of each transaction polling eth_getTransactionReceipt.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, WebSocketProvider
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+logger = logging.getLogger(__name__)
+
+
+async def wait_receipt_backoff(
+    web3,
+    tx_hash,
+    timeout: float = 60,
+    poll_latency: float = 1.0,
+    max_poll_latency: float = 4.0
+):
+    """
+    Poll for a receipt, doubling the interval after each miss.
+
+    The first lookup is immediate; later ones wait `poll_latency`,
+    then twice that, up to `max_poll_latency`.
+
+    Raises:
+        TimeExhausted: If the receipt is not available within `timeout`
+    """
+    deadline = time.monotonic() + timeout
+    delay = poll_latency
+    while True:
+        try:
+            return await web3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeExhausted(
+                f"Transaction {HexBytes(tx_hash).hex()} is not in the chain after {timeout} seconds"
+            )
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_poll_latency)
+
+
+class ReceiptWatcher:
+    """Resolves receipt futures on each new block header."""
+
+    def __init__(
+        self,
+        ws_url: str,
+        web3,
+        timeout: float = 120,
+        poll_latency: float = 1.0,
+        max_poll_latency: float = 4.0
+    ):
+        self.ws_url = ws_url
+        self.web3 = web3  # HTTP client used for the receipt lookups
+        self.timeout = timeout
+        # Backoff bounds for the polling fallback
+        self.poll_latency = poll_latency
+        self.max_poll_latency = max_poll_latency
+        self._pending: Dict[HexBytes, asyncio.Future] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the subscription task (call on shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def wait_for_receipt(self, tx_hash, timeout: Optional[float] = None):
+        """
+        Wait until `tx_hash` is mined and return its receipt.
+
+        Falls back to polling with exponential backoff when no WebSocket URL
+        is configured.
+        `timeout` defaults to the watcher's timeout.
+
+        Raises:
+            TimeExhausted: If the receipt is not available within `timeout`
+        """
+        if timeout is None:
+            timeout = self.timeout
+        if not self.ws_url:
+            return await wait_receipt_backoff(
+                self.web3, tx_hash, timeout, self.poll_latency, self.max_poll_latency
+            )
+
+        tx_hash = HexBytes(tx_hash)
+        self._ensure_running()
+        future = self._pending.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[tx_hash] = future
+        try:
+            # The tx may already be mined (e.g. automine), and no further
+            # head would arrive to resolve it
+            try:
+                receipt = await self.web3.eth.get_transaction_receipt(tx_hash)
+                if not future.done():
+                    future.set_result(receipt)
+            except TransactionNotFound:
+                pass
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(
+                f"Transaction {tx_hash.hex()} is not in the chain after {timeout} seconds"
+            )
+        finally:
+            if self._pending.get(tx_hash) is future:
+                del self._pending[tx_hash]
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with AsyncWeb3(WebSocketProvider(self.ws_url)) as ws_w3:
+                    await ws_w3.eth.subscribe('newHeads')
+                    logger.info("Subscribed to newHeads for receipt tracking")
+                    # Catch up on anything mined while (re)connecting
+                    await self._check_pending()
+                    async for _ in ws_w3.socket.process_subscriptions():
+                        await self._check_pending()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("newHeads subscription dropped: %s; reconnecting", e)
+                await asyncio.sleep(1)
+
+    async def _check_pending(self) -> None:
+        waiting = [h for h, f in self._pending.items() if not f.done()]
+        if not waiting:
+            return
+        # One JSON-RPC batch for every in-flight hash. The raw provider call
+        # is used because web3's batch API raises if any receipt is missing.
+        try:
+            responses = await self.web3.provider.make_batch_request(
+                [('eth_getTransactionReceipt', [h.to_0x_hex()]) for h in waiting]
+            )
+        except Exception as e:
+            logger.warning("Batched receipt lookup failed: %s", e)
+            return
+        if not isinstance(responses, list):
+            # Node rejected the whole batch
+            logger.warning("Batched receipt lookup failed: %s", responses)
+            return
+        for tx_hash, response in zip(waiting, responses):
+            result = response.get('result')
+            if result is None:
+                if 'error' in response:
+                    logger.warning("Receipt lookup failed for %s: %s", tx_hash.hex(), response['error'])
+                continue
+            future = self._pending.get(tx_hash)
+            if future is not None and not future.done():
+                future.set_result(AttributeDict.recursive(receipt_formatter(result)))
+
+
+class ConfirmationQueue:
+    """
+    Background worker for fire-and-forget transactions.
+    Submitted tx hashes are awaited through the receipt watcher and their
+    completion callbacks run once mined, off the request path.
+    """
+
+    def __init__(self, watcher: ReceiptWatcher, timeout: Optional[float] = None):
+        self.watcher = watcher
+        self.timeout = timeout
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._waiters: Set[asyncio.Task] = set()
+
+    def submit(
+        self,
+        tx_hash,
+        callback: Callable[[HexBytes, Any], Awaitable[None]],
+        on_timeout: Optional[Callable[[HexBytes], Awaitable[None]]] = None
+    ) -> None:
+        """
+        Queue `callback(tx_hash, receipt)` to run when `tx_hash` is mined.
+
+        `on_timeout(tx_hash)` runs instead if the receipt wait gives up.
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        self._queue.put_nowait((HexBytes(tx_hash), callback, on_timeout))
+
+    async def stop(self) -> None:
+        """Cancel the worker and any outstanding waits (call on shutdown)."""
+        tasks = list(self._waiters)
+        if self._worker is not None:
+            tasks.append(self._worker)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+
+    async def _run(self) -> None:
+        while True:
+            tx_hash, callback, on_timeout = await self._queue.get()
+            task = asyncio.create_task(self._confirm(tx_hash, callback, on_timeout))
+            self._waiters.add(task)
+            task.add_done_callback(self._waiters.discard)
+
+    async def _confirm(self, tx_hash: HexBytes, callback, on_timeout) -> None:
+        try:
+            receipt = await self.watcher.wait_for_receipt(tx_hash, timeout=self.timeout)
+        except Exception as e:
+            logger.error("Gave up waiting for %s: %s", tx_hash.hex(), e)
+            if on_timeout is not None:
+                try:
+                    await on_timeout(tx_hash)
+                except Exception as e:
+                    logger.error("Timeout callback failed for %s: %s", tx_hash.hex(), e)
+            return
+        try:
+            await callback(tx_hash, receipt)
+        except Exception as e:
+            logger.error("Confirmation callback failed for %s: %s", tx_hash.hex(), e)
@@ -0,0 +1,47 @@
+"""
+Shared transaction submission path.
+Every single-transaction write reserves its nonce, prices, signs and
+sends through send_transaction, so those steps are implemented once.
+"""
+from typing import Any, Dict
+
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
+from web3.exceptions import TransactionNotFound
+
+from .client import async_w3, fetch_tx_params, nonce_manager, rpc_semaphore
+from .wallets import sign_tx_async
+
+async def send_transaction(account: LocalAccount, tx: Dict[str, Any]) -> HexBytes:
+    """
+    Sign and submit a transaction from `account`.
+
+    The nonce and fee fields are filled in from fetch_tx_params(); the
+    local nonce counter is resynced if the tx is not accepted.
+
+    Args:
+        account: Account that signs and sends the transaction
+        tx: Transaction fields without nonce or fees (to, value, gas,
+            chainId, data, ...)
+
+    Returns:
+        Transaction hash
+    """
+    tx_params = await fetch_tx_params(account.address)
+    try:
+        signed_tx = await sign_tx_async(account, {**tx, **tx_params})
+        # Bounded by the shared RPC in-flight limit
+        async with rpc_semaphore:
+            return await async_w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+    except Exception:
+        nonce_manager.reset(account.address)
+        raise
+
+
+async def is_transaction_known(tx_hash) -> bool:
+    """True if the node has `tx_hash`, mined or still pending in its mempool."""
+    try:
+        await async_w3.eth.get_transaction(tx_hash)
+    except TransactionNotFound:
+        return False
+    return True
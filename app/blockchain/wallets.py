@@ -2,12 +2,21 @@
 Blockchain wallet generation and management utilities.
 """
 import os
+import asyncio
 import logging
+import threading
+from typing import Any, Dict
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
 from web3 import Web3
 
 logger = logging.getLogger(__name__)
 
+# Derived accounts keyed on the raw 32-byte private key, so repeated
+# transactions by the same user skip the secp256k1 public key derivation
+_ACCOUNT_CACHE: Dict[bytes, LocalAccount] = {}
+_ACCOUNT_CACHE_LOCK = threading.Lock()
+
 
 def generate_new_wallet() -> dict:
     """
@@ -25,21 +34,51 @@ def generate_new_wallet() -> dict:
     }
 
 
-async def fund_wallet_with_gas(wallet_address: str, amount_eth: float = 0.1) -> str:
+async def generate_new_wallet_async() -> dict:
+    """
+    Generate a new wallet off the event loop.
+    
+    Returns:
+        dict: Contains 'address' and 'private_key'
+    """
+    return await asyncio.to_thread(generate_new_wallet)
+
+
+async def sign_tx_async(account: LocalAccount, tx: Dict[str, Any]):
+    """
+    Sign a transaction off the event loop (ECDSA signing is CPU-bound).
+    
+    Args:
+        account: Account to sign with
+        tx: Transaction dict
+        
+    Returns:
+        SignedTransaction
+    """
+    return await asyncio.to_thread(account.sign_transaction, tx)
+
+
+async def submit_fund_wallet_with_gas(wallet_address: str, amount_eth: float = 0.1) -> str:
     """
     Send ETH from platform owner to a user wallet for gas fees.
+    Returns right after submission, without waiting for the receipt.
     
     Args:
-        wallet_address: User's wallet address to fund
+        wallet_address: User's wallet address to fund (checksummed)
         amount_eth: Amount of ETH to send (default 0.1 ETH)
         
     Returns:
-        Transaction hash as hex string
+        Transaction hash as hex string (not yet mined)
         
     Raises:
         Exception: If transaction fails
     """
-    from .client import w3, owner_account, CHAIN_ID, is_blockchain_enabled
+    from .client import (
+        owner_account,
+        CHAIN_ID,
+        is_blockchain_enabled
+    )
+    from .transactions import send_transaction
     
     if not is_blockchain_enabled():
         raise Exception("Blockchain not configured")
@@ -49,53 +88,76 @@ async def fund_wallet_with_gas(wallet_address: str, amount_eth: float = 0.1) ->
     
     try:
         # Convert ETH to Wei
-        amount_wei = w3.to_wei(amount_eth, 'ether')
+        amount_wei = Web3.to_wei(amount_eth, 'ether')
         
         # Build transaction
         tx = {
             'from': owner_account.address,
-            'to': Web3.to_checksum_address(wallet_address),
+            'to': wallet_address,
             'value': amount_wei,
-            'nonce': w3.eth.get_transaction_count(owner_account.address),
             'gas': 21000,  # Standard ETH transfer gas
-            'gasPrice': w3.eth.gas_price,
             'chainId': CHAIN_ID
         }
         
-        # Sign transaction
-        signed_tx = owner_account.sign_transaction(tx)
-        
-        # Send transaction
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        
-        logger.info(f"💰 Sent {amount_eth} ETH to {wallet_address} for gas fees: {tx_hash.hex()}")
+        # Sign and send transaction
+        tx_hash = await send_transaction(owner_account, tx)
+        tx_hash_hex = tx_hash.hex()
         
-        # Wait for receipt
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        logger.info("💰 Sent %s ETH to %s for gas fees: %s", amount_eth, wallet_address, tx_hash_hex)
         
-        if receipt['status'] != 1:
-            raise Exception(f"Transaction failed: {tx_hash.hex()}")
-        
-        logger.info(f"✅ Gas funding successful: {tx_hash.hex()}")
-        return tx_hash.hex()
+        return tx_hash_hex
         
     except Exception as e:
-        logger.error(f"Error funding wallet {wallet_address}: {e}")
+        logger.error("Error funding wallet %s: %s", wallet_address, e)
         raise
 
 
-def get_account_from_private_key(private_key: str) -> Account:
+async def fund_wallet_with_gas(wallet_address: str, amount_eth: float = 0.1) -> str:
+    """
+    Send ETH from platform owner to a user wallet and wait until it is mined.
+    
+    Args:
+        wallet_address: User's wallet address to fund
+        amount_eth: Amount of ETH to send (default 0.1 ETH)
+        
+    Returns:
+        Transaction hash as hex string
+        
+    Raises:
+        Exception: If transaction fails
+    """
+    from .client import receipt_watcher
+    
+    tx_hash = await submit_fund_wallet_with_gas(wallet_address, amount_eth)
+    
+    receipt = await receipt_watcher.wait_for_receipt(tx_hash)
+    if receipt['status'] != 1:
+        raise Exception(f"Transaction failed: {tx_hash}")
+    
+    logger.info("✅ Gas funding successful: %s", tx_hash)
+    return tx_hash
+
+
+def get_account_from_private_key(private_key: str) -> LocalAccount:
     """
     Get an Account object from a private key.
     
+    Derived accounts are cached per key.
+    
     Args:
         private_key: Hex-encoded private key (with or without 0x prefix)
         
     Returns:
-        Account: eth_account Account object
+        LocalAccount: eth_account account object
     """
-    if not private_key.startswith('0x'):
-        private_key = '0x' + private_key
+    key_bytes = bytes.fromhex(private_key[2:] if private_key.startswith('0x') else private_key)
     
-    return Account.from_key(private_key)
+    account = _ACCOUNT_CACHE.get(key_bytes)
+    if account is None:
+        with _ACCOUNT_CACHE_LOCK:
+            account = _ACCOUNT_CACHE.get(key_bytes)
+            if account is None:
+                account = Account.from_key(key_bytes)
+                _ACCOUNT_CACHE[key_bytes] = account
+    return account
 
@@ -3,12 +3,50 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     
     DATABASE_URL: str = "sqlite+aiosqlite:///./app.db"
+    # Database connection pool; connections are recycled after DB_POOL_RECYCLE seconds
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    # Run create_all at startup (upgrades of existing tables always run)
+    AUTO_CREATE_TABLES: bool = True
     INITIAL_USER_BALANCE_USD: float = 10000.0
     
     BLOCKCHAIN_RPC_URL: str = ""
+    BLOCKCHAIN_WS_URL: str = ""  # enables newHeads-based receipt tracking
     PROPERTY_FACTORY_ADDRESS: str = ""
     OWNER_PRIVATE_KEY: str = ""
-    CHAIN_ID: str = "1337"
+    CHAIN_ID: int = 1337
+    # Multicall3 is deployed at the same address on most chains
+    MULTICALL3_ADDRESS: str = "0xcA11bde05977b3631167028862bE2a173976CA11"
+    
+    # Max concurrent transaction submissions (send + receipt wait) to the RPC node
+    RPC_MAX_INFLIGHT: int = 16
+    
+    # Send EIP-1559 (type 2) transactions priced from fee history; set False
+    # for chains without a base fee to use the legacy gas price instead
+    USE_EIP1559: bool = True
+    
+    # Seconds to reuse the legacy gas price across transactions
+    GAS_PRICE_CACHE_TTL_SECONDS: float = 3.0
+    
+    # Seconds to cache contract view calls (0 disables caching)
+    VIEW_CACHE_TTL_SECONDS: float = 12.0
+    
+    # Seconds to cache marketplace stats (0 disables caching)
+    MARKETPLACE_STATS_CACHE_TTL_SECONDS: float = 10.0
+    
+    # Seconds to cache single listing details (0 disables caching)
+    LISTING_CACHE_TTL_SECONDS: float = 30.0
+    
+    # Receipt polling backoff (HTTP fallback): starts at RECEIPT_POLL_LATENCY,
+    # doubles up to RECEIPT_POLL_MAX_LATENCY; RECEIPT_TIMEOUT bounds the wait
+    RECEIPT_POLL_LATENCY: float = 1.0
+    RECEIPT_POLL_MAX_LATENCY: float = 4.0
+    RECEIPT_TIMEOUT: int = 60
+    
+    # Tracked transactions still unconfirmed this long after submission are
+    # marked dropped on startup instead of being re-queued
+    CHAIN_TX_RESUME_MAX_AGE_SECONDS: int = 86400
     
     class Config:
         env_file = ".env"
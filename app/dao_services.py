@@ -2,18 +2,32 @@
 DAO Governance Services - Token-weighted off-chain voting.
 """
 from datetime import datetime
+from decimal import Decimal, ROUND_DOWN
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, update, and_, cast, Float, lambda_stmt, tuple_
+from sqlalchemy.orm import selectinload, raiseload, defer
 from fastapi import HTTPException
 import logging
 
-from app.models import DaoProposal, DaoVote, Property, UserPropertyBalance, User
+from app.db import upsert_insert
+from app.models import DaoProposal, DaoProposalTally, DaoVote, Property, UserPropertyBalance, User
 from app.schemas import DaoProposalCreate, DaoVoteCreate, DaoProposalResult
 
 logger = logging.getLogger(__name__)
 
+CENT = Decimal("0.01")
+
+
+def _dao_select(*entities):
+    """
+    select() with lazy relationship loading disabled.
+    
+    Loads are planned explicitly in this module; an unplanned relationship
+    access raises instead of silently emitting another SELECT.
+    """
+    return select(*entities).options(raiseload("*"))
+
 
 async def create_dao_proposal(
     db: AsyncSession,
@@ -29,31 +43,36 @@ async def create_dao_proposal(
     Returns:
         Created DaoProposal instance
     """
+    # Fetch property supply, creator and creator's balance in one query,
+    # as plain columns rather than entities
+    property_id = proposal_create.property_id
+    creator_id = proposal_create.created_by_user_id
+    lookup_result = await db.execute(lambda_stmt(
+        lambda: select(Property.tokens_sold, Property.total_tokens, User.id, UserPropertyBalance.tokens)
+        .select_from(Property)
+        .outerjoin(User, User.id == creator_id)
+        .outerjoin(
+            UserPropertyBalance,
+            and_(
+                UserPropertyBalance.user_id == User.id,
+                UserPropertyBalance.property_id == Property.id
+            )
+        )
+        .where(Property.id == property_id)
+    ))
+    row = lookup_result.one_or_none()
+    
     # Verify property exists
-    property_result = await db.execute(
-        select(Property).where(Property.id == proposal_create.property_id)
-    )
-    property_obj = property_result.scalar_one_or_none()
-    if not property_obj:
+    if row is None:
         raise HTTPException(status_code=404, detail="Property not found")
+    tokens_sold, total_tokens, user_id, balance_tokens = row
     
     # Verify creator exists
-    user_result = await db.execute(
-        select(User).where(User.id == proposal_create.created_by_user_id)
-    )
-    user = user_result.scalar_one_or_none()
-    if not user:
+    if user_id is None:
         raise HTTPException(status_code=404, detail="User not found")
     
     # Verify creator owns tokens in this property
-    balance_result = await db.execute(
-        select(UserPropertyBalance).where(
-            UserPropertyBalance.user_id == proposal_create.created_by_user_id,
-            UserPropertyBalance.property_id == proposal_create.property_id
-        )
-    )
-    balance = balance_result.scalar_one_or_none()
-    if not balance or balance.tokens <= 0:
+    if not balance_tokens or balance_tokens <= 0:
         raise HTTPException(
             status_code=403,
             detail="Only token holders can create proposals for this property"
@@ -67,31 +86,21 @@ async def create_dao_proposal(
         )
     
     # Check if property is fully funded (all tokens sold)
-    if property_obj.tokens_sold < property_obj.total_tokens:
+    if tokens_sold < total_tokens:
         raise HTTPException(
             status_code=400,
             detail="Cannot create proposal: property must be fully funded (all tokens sold)"
         )
     
-    # Determine status based on dates
-    now = datetime.utcnow()
-    status = "active"  # Default to active so users can vote immediately
-    if proposal_create.start_at and proposal_create.end_at:
-        # Make start_at and end_at timezone-naive for comparison
-        start_at_naive = proposal_create.start_at.replace(tzinfo=None) if proposal_create.start_at.tzinfo else proposal_create.start_at
-        end_at_naive = proposal_create.end_at.replace(tzinfo=None) if proposal_create.end_at.tzinfo else proposal_create.end_at
-        
-        if start_at_naive >= end_at_naive:
-            raise HTTPException(
-                status_code=400,
-                detail="start_at must be before end_at"
-            )
-        if now < start_at_naive:
-            status = "draft"  # Not started yet
-        elif start_at_naive <= now < end_at_naive:
-            status = "active"
-        elif now >= end_at_naive:
-            status = "closed"
+    # Draft/active/closed follow from the dates on read (current_status),
+    # so the stored status starts out active
+    start_at = proposal_create.start_at
+    end_at = proposal_create.end_at
+    if start_at and end_at and start_at >= end_at:
+        raise HTTPException(
+            status_code=400,
+            detail="start_at must be before end_at"
+        )
     
     # Create proposal
     proposal = DaoProposal(
@@ -100,47 +109,84 @@ async def create_dao_proposal(
         description=proposal_create.description,
         proposal_type=proposal_create.proposal_type,
         options_json=proposal_create.options,
+        num_options=len(proposal_create.options),
         min_quorum_percent=proposal_create.min_quorum_percent,
-        status=status,
-        start_at=proposal_create.start_at,
-        end_at=proposal_create.end_at,
-        created_by_user_id=proposal_create.created_by_user_id,
-        created_at=now,
-        updated_at=now
+        status="active",
+        start_at=start_at,
+        end_at=end_at,
+        created_by_user_id=proposal_create.created_by_user_id
     )
     
+    # id, version and the database-set timestamps are populated by the
+    # flush, so no refresh is needed
     db.add(proposal)
     await db.commit()
-    await db.refresh(proposal)
     
-    logger.info(f"Created DAO proposal {proposal.id} for property {proposal.property_id}")
+    logger.info("Created DAO proposal %s for property %s", proposal.id, proposal.property_id)
     return proposal
 
 
 async def get_proposal(db: AsyncSession, proposal_id: int) -> DaoProposal:
     """Get a proposal by ID."""
-    result = await db.execute(
-        select(DaoProposal).where(DaoProposal.id == proposal_id)
-    )
+    result = await db.execute(lambda_stmt(
+        lambda: _dao_select(DaoProposal).where(DaoProposal.id == proposal_id)
+    ))
     proposal = result.scalar_one_or_none()
     if not proposal:
         raise HTTPException(status_code=404, detail="Proposal not found")
     return proposal
 
 
+def _with_status(query, status: str):
+    """
+    Filter proposals by current_status.
+    
+    Draft and active proposals are always stored as active, so that
+    predicate is added too and lets ix_dao_proposal_property_active apply.
+    """
+    if status in ("draft", "active"):
+        query = query.where(DaoProposal.status == "active")
+    return query.where(DaoProposal.current_status == status)
+
+
+def _newest_first_page(
+    query,
+    limit: int,
+    after_created_at: Optional[datetime],
+    after_id: Optional[int]
+):
+    """
+    Order proposals newest first and apply keyset pagination.
+    
+    Pass the created_at and id of the last proposal of the previous page
+    as the cursor to get the next page.
+    """
+    if after_created_at is not None and after_id is not None:
+        query = query.where(
+            tuple_(DaoProposal.created_at, DaoProposal.id)
+            < (after_created_at, after_id)
+        )
+    return query.order_by(DaoProposal.created_at.desc(), DaoProposal.id.desc()).limit(limit)
+
+
 async def get_all_proposals(
     db: AsyncSession,
     user_id: Optional[int] = None,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    limit: int = 50,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None
 ) -> list[DaoProposal]:
-    """Get all proposals, optionally filtered by user or status."""
-    query = select(DaoProposal).order_by(DaoProposal.created_at.desc())
+    """Get a page of proposals, optionally filtered by user or status."""
+    query = _dao_select(DaoProposal)
     
     if user_id:
         query = query.where(DaoProposal.created_by_user_id == user_id)
     
     if status:
-        query = query.where(DaoProposal.status == status)
+        query = _with_status(query, status)
+    
+    query = _newest_first_page(query, limit, after_created_at, after_id)
     
     result = await db.execute(query)
     return list(result.scalars().all())
@@ -149,20 +195,64 @@ async def get_all_proposals(
 async def get_property_proposals(
     db: AsyncSession,
     property_id: int,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    limit: int = 50,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None
 ) -> list[DaoProposal]:
-    """Get all proposals for a property, optionally filtered by status."""
-    query = select(DaoProposal).where(DaoProposal.property_id == property_id)
+    """Get a page of proposals for a property, optionally filtered by status."""
+    query = _dao_select(DaoProposal).where(DaoProposal.property_id == property_id)
     
     if status:
-        query = query.where(DaoProposal.status == status)
+        query = _with_status(query, status)
     
-    query = query.order_by(DaoProposal.created_at.desc())
+    query = _newest_first_page(query, limit, after_created_at, after_id)
     
     result = await db.execute(query)
     return list(result.scalars().all())
 
 
+async def get_property_proposals_with_results(
+    db: AsyncSession,
+    property_id: int,
+    status: Optional[str] = None,
+    limit: int = 50,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None
+) -> list[tuple[DaoProposal, DaoProposalResult]]:
+    """
+    Get a page of proposals for a property together with their results.
+    
+    Same paging and filtering as get_property_proposals, but the page and
+    every proposal's tallies are loaded in one statement instead of one
+    compute_proposal_results call per proposal.
+    """
+    page = select(DaoProposal.id).where(DaoProposal.property_id == property_id)
+    if status:
+        page = _with_status(page, status)
+    page = _newest_first_page(page, limit, after_created_at, after_id).cte("page")
+    
+    result = await db.execute(
+        _dao_select(DaoProposal, Property.total_tokens, *_tally_columns())
+        .join(page, page.c.id == DaoProposal.id)
+        .join(Property, Property.id == DaoProposal.property_id)
+        .outerjoin(DaoProposalTally, DaoProposalTally.proposal_id == DaoProposal.id)
+        .order_by(
+            DaoProposal.created_at.desc(),
+            DaoProposal.id.desc(),
+            DaoProposalTally.weight_tokens.desc(),
+            DaoProposalTally.option_index
+        )
+    )
+    
+    # Rows arrive grouped by proposal, newest first
+    grouped: dict[int, list] = {}
+    for row in result.all():
+        grouped.setdefault(row[0].id, []).append(row)
+    
+    return [(rows[0][0], _proposal_results(rows)) for rows in grouped.values()]
+
+
 async def cast_vote(
     db: AsyncSession,
     proposal_id: int,
@@ -180,89 +270,88 @@ async def cast_vote(
     Returns:
         Created DaoVote instance
     """
-    # Get proposal
-    proposal = await get_proposal(db, proposal_id)
+    # Fetch proposal, user and their balance for the property in one query.
+    # The options are not needed to vote, only their count (num_options).
+    voter_id = vote_create.user_id
+    lookup_result = await db.execute(lambda_stmt(
+        lambda: _dao_select(DaoProposal, User.id, UserPropertyBalance.tokens)
+        .options(defer(DaoProposal.options_json, raiseload=True))
+        .select_from(DaoProposal)
+        .outerjoin(User, User.id == voter_id)
+        .outerjoin(
+            UserPropertyBalance,
+            and_(
+                UserPropertyBalance.user_id == User.id,
+                UserPropertyBalance.property_id == DaoProposal.property_id
+            )
+        )
+        .where(DaoProposal.id == proposal_id)
+    ))
+    row = lookup_result.one_or_none()
+    
+    # Verify proposal exists
+    if row is None:
+        raise HTTPException(status_code=404, detail="Proposal not found")
+    proposal, user_id, balance_tokens = row
     
     # Check proposal is active
-    if proposal.status != "active":
+    current_status = proposal.current_status
+    if current_status != "active":
         raise HTTPException(
             status_code=400,
-            detail=f"Proposal is {proposal.status}, not active"
+            detail=f"Proposal is {current_status}, not active"
         )
     
-    # Check voting period
+    # Check voting period (stored as naive UTC)
     now = datetime.utcnow()
-    if proposal.start_at:
-        start_at_naive = proposal.start_at.replace(tzinfo=None) if proposal.start_at.tzinfo else proposal.start_at
-        if now < start_at_naive:
-            raise HTTPException(status_code=400, detail="Voting has not started yet")
-    if proposal.end_at:
-        end_at_naive = proposal.end_at.replace(tzinfo=None) if proposal.end_at.tzinfo else proposal.end_at
-        if now > end_at_naive:
-            raise HTTPException(status_code=400, detail="Voting has ended")
+    if proposal.start_at and now < proposal.start_at:
+        raise HTTPException(status_code=400, detail="Voting has not started yet")
+    if proposal.end_at and now > proposal.end_at:
+        raise HTTPException(status_code=400, detail="Voting has ended")
     
     # Verify user exists
-    user_result = await db.execute(
-        select(User).where(User.id == vote_create.user_id)
-    )
-    user = user_result.scalar_one_or_none()
-    if not user:
+    if user_id is None:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # Get user's token balance for this property
-    balance_result = await db.execute(
-        select(UserPropertyBalance).where(
-            UserPropertyBalance.user_id == vote_create.user_id,
-            UserPropertyBalance.property_id == proposal.property_id
-        )
-    )
-    balance = balance_result.scalar_one_or_none()
-    
-    if not balance or balance.tokens <= 0:
+    if not balance_tokens or balance_tokens <= 0:
         raise HTTPException(
             status_code=403,
             detail="You must own tokens in this property to vote"
         )
     
     # Validate option index
-    if vote_create.selected_option_index < 0 or \
-       vote_create.selected_option_index >= len(proposal.options_json):
+    if not 0 <= vote_create.selected_option_index < proposal.num_options:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid option index. Must be 0-{len(proposal.options_json)-1}"
+            detail=f"Invalid option index. Must be 0-{proposal.num_options - 1}"
         )
     
-    # Check if user already voted
-    existing_vote_result = await db.execute(
-        select(DaoVote).where(
-            DaoVote.proposal_id == proposal_id,
-            DaoVote.user_id == vote_create.user_id
+    # Create vote with weight = current token balance; the unique
+    # (proposal_id, user_id) constraint rejects a second vote atomically
+    vote_result = await db.scalars(
+        upsert_insert(db, DaoVote)
+        .values(
+            proposal_id=proposal_id,
+            user_id=vote_create.user_id,
+            selected_option_index=vote_create.selected_option_index,
+            weight_tokens=balance_tokens
         )
+        .on_conflict_do_nothing(index_elements=["proposal_id", "user_id"])
+        .returning(DaoVote)
     )
-    existing_vote = existing_vote_result.scalar_one_or_none()
+    vote = vote_result.first()
     
-    if existing_vote:
+    if vote is None:
         raise HTTPException(
             status_code=400,
             detail="You have already voted on this proposal"
         )
     
-    # Create vote with weight = current token balance
-    vote = DaoVote(
-        proposal_id=proposal_id,
-        user_id=vote_create.user_id,
-        selected_option_index=vote_create.selected_option_index,
-        weight_tokens=balance.tokens,
-        created_at=datetime.utcnow()
-    )
-    
-    db.add(vote)
     await db.commit()
-    await db.refresh(vote)
     
     logger.info(
-        f"User {vote_create.user_id} voted on proposal {proposal_id} "
-        f"with weight {balance.tokens} tokens"
+        "User %s voted on proposal %s with weight %s tokens",
+        voter_id, proposal_id, balance_tokens
     )
     
     return vote
@@ -282,59 +371,83 @@ async def compute_proposal_results(
     Returns:
         DaoProposalResult with vote counts and percentages
     """
-    # Get proposal
-    proposal = await get_proposal(db, proposal_id)
+    # Proposal, property supply and per-option tallies (maintained by the
+    # dao_votes insert trigger) in one statement, so they come from a single snapshot even
+    # if the proposal is closed or voted on concurrently. Tallies are
+    # ordered most votes first, lowest option index on ties.
+    result = await db.execute(lambda_stmt(
+        lambda: _dao_select(DaoProposal, Property.total_tokens, *_tally_columns())
+        .join(Property, Property.id == DaoProposal.property_id)
+        .outerjoin(DaoProposalTally, DaoProposalTally.proposal_id == DaoProposal.id)
+        .where(DaoProposal.id == proposal_id)
+        .order_by(DaoProposalTally.weight_tokens.desc(), DaoProposalTally.option_index)
+    ))
+    rows = result.all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Proposal not found")
+    return _proposal_results(rows)
+
+
+def _tally_columns():
+    """
+    Per-option tally columns plus the aggregates derived from them.
     
-    # Get property to know total tokens
-    property_result = await db.execute(
-        select(Property).where(Property.id == proposal.property_id)
+    Vote share, total votes cast and quorum are computed by the database
+    with window totals over each proposal's tally rows, so result rows
+    carry everything the response needs. Select after DaoProposal and
+    Property.total_tokens, outer-joined to DaoProposalTally.
+    """
+    votes_cast = func.coalesce(
+        func.sum(DaoProposalTally.weight_tokens).over(partition_by=DaoProposal.id), 0
     )
-    property_obj = property_result.scalar_one()
-    total_tokens = property_obj.total_tokens
-    
-    # Get all votes for this proposal
-    votes_result = await db.execute(
-        select(DaoVote).where(DaoVote.proposal_id == proposal_id)
+    return (
+        DaoProposalTally.option_index,
+        DaoProposalTally.weight_tokens,
+        (
+            cast(DaoProposalTally.weight_tokens, Float) / func.nullif(votes_cast, 0) * 100
+        ).label("percentage"),
+        votes_cast.label("votes_cast"),
+        (
+            cast(votes_cast, Float) / Property.total_tokens * 100 >= DaoProposal.min_quorum_percent
+        ).label("quorum_reached"),
     )
-    votes = list(votes_result.scalars().all())
-    
-    # Count votes per option
-    option_votes = [0] * len(proposal.options_json)
-    total_votes_cast = 0
-    
-    for vote in votes:
-        option_votes[vote.selected_option_index] += vote.weight_tokens
-        total_votes_cast += vote.weight_tokens
+
+
+def _proposal_results(rows) -> DaoProposalResult:
+    """
+    Shape one proposal's tally rows (see _tally_columns), ordered most
+    votes first, into its results.
+    """
+    proposal, total_tokens, _, _, _, votes_cast, quorum_reached = rows[0]
+    tallies = {
+        option_index: (weight, percentage)
+        for _, _, option_index, weight, percentage, _, _ in rows
+        if option_index is not None
+    }
     
-    # Calculate percentages
     results = []
     for i, option in enumerate(proposal.options_json):
-        votes_for_option = option_votes[i]
-        percentage = (votes_for_option / total_votes_cast * 100) if total_votes_cast > 0 else 0.0
+        votes_for_option, percentage = tallies.get(i, (0, None))
         results.append({
             "option": option,
             "votes": votes_for_option,
-            "percentage": round(percentage, 2)
+            "percentage": round(percentage or 0.0, 2)
         })
     
-    # Check quorum
-    quorum_reached = (total_votes_cast / total_tokens * 100) >= proposal.min_quorum_percent
-    
-    # Find winning option (most votes)
+    # Winning option is the first tally row (most votes)
     winning_option = None
-    if results:
-        max_votes = max(r["votes"] for r in results)
-        if max_votes > 0:
-            winning_option = next(r["option"] for r in results if r["votes"] == max_votes)
+    _, _, top_index, top_weight, _, _, _ = rows[0]
+    if top_index is not None and top_weight > 0:
+        winning_option = proposal.options_json[top_index]
     
     return DaoProposalResult(
-        proposal_id=proposal_id,
+        proposal_id=proposal.id,
         total_tokens=total_tokens,
-        votes_cast=total_votes_cast,
-        quorum_reached=quorum_reached,
+        votes_cast=votes_cast,
+        quorum_reached=bool(quorum_reached),
         results=results,
         winning_option=winning_option,
-        status=proposal.status
+        status=proposal.current_status
     )
 
 
@@ -349,18 +462,26 @@ async def close_proposal(db: AsyncSession, proposal_id: int) -> DaoProposal:
     Returns:
         Updated DaoProposal instance
     """
-    proposal = await get_proposal(db, proposal_id)
+    # Guarded UPDATE: a concurrent transition makes this match no row
+    result = await db.execute(
+        update(DaoProposal)
+        .where(DaoProposal.id == proposal_id, DaoProposal.current_status != "closed")
+        .values(
+            status="closed",
+            version=DaoProposal.version + 1
+        )
+        .returning(DaoProposal)
+    )
+    proposal = result.scalar_one_or_none()
     
-    if proposal.status == "closed":
+    if proposal is None:
+        # Raises 404 if the proposal does not exist
+        await get_proposal(db, proposal_id)
         raise HTTPException(status_code=400, detail="Proposal is already closed")
     
-    proposal.status = "closed"
-    proposal.updated_at = datetime.utcnow()
-    
     await db.commit()
-    await db.refresh(proposal)
     
-    logger.info(f"Closed proposal {proposal_id}")
+    logger.info("Closed proposal %s", proposal_id)
     return proposal
 
 
@@ -378,41 +499,71 @@ async def approve_proposal(
     Returns:
         Updated DaoProposal instance
     """
-    proposal = await get_proposal(db, proposal_id)
+    # Store the winning option (most votes, first on ties) so rent status
+    # reads need no tally lookup
+    winning_option_index = (
+        select(DaoProposalTally.option_index)
+        .where(
+            DaoProposalTally.proposal_id == proposal_id,
+            DaoProposalTally.weight_tokens > 0
+        )
+        .order_by(DaoProposalTally.weight_tokens.desc(), DaoProposalTally.option_index)
+        .limit(1)
+        .scalar_subquery()
+    )
     
-    if proposal.status == "approved":
-        raise HTTPException(status_code=400, detail="Proposal is already approved")
+    # Guarded UPDATE: a concurrent transition makes this match no row
+    result = await db.execute(
+        update(DaoProposal)
+        .where(DaoProposal.id == proposal_id, DaoProposal.status != "approved")
+        .values(
+            status="approved",
+            winning_option_index=winning_option_index,
+            version=DaoProposal.version + 1
+        )
+        .returning(DaoProposal)
+    )
+    proposal = result.scalar_one_or_none()
     
-    proposal.status = "approved"
-    proposal.updated_at = datetime.utcnow()
+    if proposal is None:
+        # Raises 404 if the proposal does not exist
+        await get_proposal(db, proposal_id)
+        raise HTTPException(status_code=400, detail="Proposal is already approved")
     
     await db.commit()
-    await db.refresh(proposal)
     
-    logger.info(f"Approved proposal {proposal_id} (property {proposal.property_id})")
+    logger.info("Approved proposal %s (property %s)", proposal_id, proposal.property_id)
     return proposal
 
 
 async def get_rent_proposals(
     db: AsyncSession,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    limit: int = 50,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None
 ) -> list[DaoProposal]:
     """
-    Get all rent decision proposals.
+    Get a page of rent decision proposals.
     
     Args:
         db: Database session
         status: Optional status filter
+        limit: Maximum number of proposals to return
+        after_created_at: created_at of the last proposal of the previous page
+        after_id: id of the last proposal of the previous page
         
     Returns:
-        List of DaoProposal instances
+        List of DaoProposal instances, newest first
     """
-    query = select(DaoProposal).where(
+    query = _dao_select(DaoProposal).where(
         DaoProposal.proposal_type == "rent_decision"
-    ).order_by(DaoProposal.created_at.desc())
+    )
     
     if status:
-        query = query.where(DaoProposal.status == status)
+        query = _with_status(query, status)
+    
+    query = _newest_first_page(query, limit, after_created_at, after_id)
     
     result = await db.execute(query)
     proposals = list(result.scalars().all())
@@ -435,15 +586,53 @@ async def get_property_rent_status(
         Dict with rental status information
     """
     # Get approved rent decision proposal for this property
-    query = select(DaoProposal).where(
-        DaoProposal.property_id == property_id,
+    result = await db.execute(lambda_stmt(
+        lambda: _dao_select(DaoProposal).where(
+            DaoProposal.property_id == property_id,
+            DaoProposal.proposal_type == "rent_decision",
+            DaoProposal.status == "approved"
+        ).order_by(DaoProposal.updated_at.desc())
+    ))
+    proposal = result.scalar_one_or_none()
+    
+    return _rent_status(proposal)
+
+
+async def get_rent_statuses_bulk(
+    db: AsyncSession,
+    property_ids: list[int]
+) -> dict[int, dict]:
+    """
+    Get the rental status of several properties in one query.
+    
+    Args:
+        db: Database session
+        property_ids: Property IDs
+        
+    Returns:
+        Dict mapping property ID to its rental status information
+    """
+    query = _dao_select(DaoProposal).where(
+        DaoProposal.property_id.in_(property_ids),
         DaoProposal.proposal_type == "rent_decision",
         DaoProposal.status == "approved"
     ).order_by(DaoProposal.updated_at.desc())
     
     result = await db.execute(query)
-    proposal = result.scalar_one_or_none()
     
+    # Latest approved proposal per property
+    latest: dict[int, DaoProposal] = {}
+    for proposal in result.scalars():
+        latest.setdefault(proposal.property_id, proposal)
+    
+    return {
+        property_id: _rent_status(latest.get(property_id))
+        for property_id in property_ids
+    }
+
+
+def _rent_status(proposal: Optional[DaoProposal]) -> dict:
+    """Rental status dict for an approved rent proposal (or None)."""
     if not proposal:
         return {
             "is_rented": False,
@@ -451,12 +640,14 @@ async def get_property_rent_status(
             "approved_at": None
         }
     
-    # Get the winning option (rent amount) from proposal results
-    results = await compute_proposal_results(db, proposal.id)
+    # The winning option (rent amount) is stored at approval
+    monthly_rent = None
+    if proposal.winning_option_index is not None:
+        monthly_rent = proposal.options_json[proposal.winning_option_index]
     
     return {
         "is_rented": True,
-        "monthly_rent": results.winning_option if results.winning_option else None,
+        "monthly_rent": monthly_rent if monthly_rent else None,
         "approved_at": proposal.updated_at.isoformat() if proposal.updated_at else None,
         "proposal_id": proposal.id,
         "proposal_title": proposal.title
@@ -479,27 +670,32 @@ async def calculate_user_rent_payout(
     Returns:
         Dict with payout information
     """
-    # Get property
-    property_result = await db.execute(select(Property).where(Property.id == property_id))
-    property_obj = property_result.scalar_one_or_none()
-    if not property_obj:
+    # Get property supply and user's token balance in one query
+    lookup_result = await db.execute(lambda_stmt(
+        lambda: select(Property.total_tokens, UserPropertyBalance.tokens)
+        .outerjoin(
+            UserPropertyBalance,
+            and_(
+                UserPropertyBalance.user_id == user_id,
+                UserPropertyBalance.property_id == Property.id
+            )
+        )
+        .where(Property.id == property_id)
+    ))
+    row = lookup_result.one_or_none()
+    if row is None:
         raise HTTPException(status_code=404, detail="Property not found")
+    total_tokens, tokens = row
     
-    # Get user's token balance
-    balance_result = await db.execute(
-        select(UserPropertyBalance).where(
-            UserPropertyBalance.user_id == user_id,
-            UserPropertyBalance.property_id == property_id
-        )
-    )
-    balance = balance_result.scalar_one_or_none()
-    if not balance or balance.tokens <= 0:
+    if not tokens or tokens <= 0:
         return {
             "has_tokens": False,
             "monthly_payout": 0,
             "ownership_percentage": 0
         }
     
+    ownership_percentage = tokens * 100 / total_tokens
+    
     # Get rent status
     rent_status = await get_property_rent_status(db, property_id)
     if not rent_status["is_rented"] or not rent_status["monthly_rent"]:
@@ -507,22 +703,22 @@ async def calculate_user_rent_payout(
             "has_tokens": True,
             "is_rented": False,
             "monthly_payout": 0,
-            "ownership_percentage": (balance.tokens / property_obj.total_tokens) * 100
+            "ownership_percentage": ownership_percentage
         }
     
-    # Calculate payout
-    monthly_rent = float(rent_status["monthly_rent"])
-    ownership_percentage = (balance.tokens / property_obj.total_tokens) * 100
-    monthly_payout = monthly_rent * (balance.tokens / property_obj.total_tokens)
+    # Calculate payout in exact decimal, rounded down to the cent so the
+    # holders' payouts never add up to more than the rent
+    monthly_rent = Decimal(rent_status["monthly_rent"])
+    monthly_payout = (monthly_rent * tokens / total_tokens).quantize(CENT, rounding=ROUND_DOWN)
     
     return {
         "has_tokens": True,
         "is_rented": True,
-        "monthly_rent": monthly_rent,
-        "tokens_owned": balance.tokens,
-        "total_tokens": property_obj.total_tokens,
+        "monthly_rent": float(monthly_rent),
+        "tokens_owned": tokens,
+        "total_tokens": total_tokens,
         "ownership_percentage": ownership_percentage,
-        "monthly_payout": monthly_payout
+        "monthly_payout": float(monthly_payout)
     }
 
 
@@ -559,59 +755,66 @@ async def claim_rent(
     if monthly_payout <= 0:
         raise HTTPException(status_code=400, detail="No rent to claim")
     
-    # Check if user has already claimed for this month
+    # Claim period is the current month
     now = datetime.utcnow()
     current_month = now.month
     current_year = now.year
-    
-    existing_claim_query = select(RentClaim).where(
-        RentClaim.user_id == user_id,
-        RentClaim.property_id == property_id,
-        RentClaim.claim_period_month == current_month,
-        RentClaim.claim_period_year == current_year
+    claim_period = now.strftime('%B %Y')
+    
+    # Record the claim; the unique (user, property, period) constraint
+    # rejects a second claim for the month atomically
+    claim_result = await db.execute(
+        upsert_insert(db, RentClaim)
+        .values(
+            user_id=user_id,
+            property_id=property_id,
+            amount_claimed_usd=monthly_payout,
+            tokens_owned_at_claim=payout_info["tokens_owned"],
+            monthly_rent_at_claim=payout_info["monthly_rent"],
+            claim_period_month=current_month,
+            claim_period_year=current_year,
+            created_at=now
+        )
+        .on_conflict_do_nothing(
+            index_elements=["user_id", "property_id", "claim_period_year", "claim_period_month"]
+        )
+        .returning(RentClaim.id)
     )
-    existing_claim_result = await db.execute(existing_claim_query)
-    existing_claim = existing_claim_result.scalar_one_or_none()
     
-    if existing_claim:
+    if claim_result.first() is None:
+        # First day of next month, rolling December over into January
+        next_period = datetime(current_year + current_month // 12, current_month % 12 + 1, 1)
         raise HTTPException(
             status_code=400, 
-            detail=f"You have already claimed rent for this property in {now.strftime('%B %Y')}. Next claim available on {now.replace(day=1, month=now.month % 12 + 1).strftime('%B 1, %Y')}."
+            detail=f"You have already claimed rent for this property in {claim_period}. Next claim available on {next_period.strftime('%B 1, %Y')}."
         )
     
-    # Get user
-    user_result = await db.execute(select(User).where(User.id == user_id))
-    user = user_result.scalar_one_or_none()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # Create rent claim record
-    rent_claim = RentClaim(
-        user_id=user_id,
-        property_id=property_id,
-        amount_claimed_usd=monthly_payout,
-        tokens_owned_at_claim=payout_info["tokens_owned"],
-        monthly_rent_at_claim=payout_info["monthly_rent"],
-        claim_period_month=current_month,
-        claim_period_year=current_year
+    # Add rent to user's balance in the database, not read-modify-write
+    balance_result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(
+            mock_balance_usd=User.mock_balance_usd + monthly_payout,
+            updated_at=now
+        )
+        .returning(User.mock_balance_usd)
     )
-    db.add(rent_claim)
-    
-    # Add rent to user's balance
-    user.mock_balance_usd += monthly_payout
-    user.updated_at = datetime.utcnow()
+    new_balance = balance_result.scalar_one_or_none()
+    if new_balance is None:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="User not found")
     
     await db.commit()
-    await db.refresh(user)
     
     logger.info(
-        f"User {user_id} claimed ${monthly_payout:.2f} rent from property {property_id} for {now.strftime('%B %Y')}"
+        "User %s claimed $%.2f rent from property %s for %s",
+        user_id, monthly_payout, property_id, claim_period
     )
     
     return {
         "success": True,
         "amount_claimed": monthly_payout,
-        "new_balance": user.mock_balance_usd,
+        "new_balance": float(new_balance),
         "property_id": property_id,
-        "claim_period": f"{now.strftime('%B %Y')}"
+        "claim_period": claim_period
     }
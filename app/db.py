@@ -1,11 +1,25 @@
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.config import settings
 
+# SQLite file databases run on NullPool, which takes no sizing arguments
+pool_kwargs = {}
+if not settings.DATABASE_URL.startswith("sqlite"):
+    pool_kwargs = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
     future=True,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Room for the compiled forms of every statement shape in the services
+    query_cache_size=1200,
+    **pool_kwargs,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -18,6 +32,18 @@ AsyncSessionLocal = async_sessionmaker(
 
 Base = declarative_base()
 
+def upsert_insert(db: AsyncSession, table):
+    """
+    INSERT construct for the session's dialect, which adds the
+    on_conflict_do_nothing / on_conflict_do_update clauses.
+    """
+    dialect = db.bind.dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(table)
+    if dialect == "sqlite":
+        return sqlite.insert(table)
+    raise RuntimeError(f"No INSERT ... ON CONFLICT support for the {dialect} dialect")
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         try:
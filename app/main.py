@@ -4,10 +4,19 @@ FastAPI application entry point.
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine
 
-from app.db import Base, engine as async_engine
+from app.db import engine as async_engine
 from app.config import settings
+from app.migrations import upgrade_schema
+from app.blockchain.client import (
+    BLOCKCHAIN_CONFIGURED,
+    refresh_node_connection,
+    open_async_session,
+    close_async_session,
+    receipt_watcher,
+    confirmation_queue
+)
+from app.services import resume_pending_chain_transactions
 from app.routers import users, properties, investments, portfolio, blockchain, dao, marketplace
 
 
@@ -16,16 +25,27 @@ async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
     """
-    # Startup: Create database tables
-    # We need to use a sync engine for create_all
-    sync_database_url = settings.DATABASE_URL.replace("+aiosqlite", "")
-    sync_engine = create_engine(sync_database_url, echo=False)
-    Base.metadata.create_all(bind=sync_engine)
-    sync_engine.dispose()
+    # Startup: Create database tables (disable where the schema is managed
+    # separately) and upgrade the ones created by earlier versions
+    async with async_engine.begin() as conn:
+        await conn.run_sync(upgrade_schema, settings.AUTO_CREATE_TABLES)
+    
+    # Pooled keep-alive session for async RPC calls
+    await open_async_session()
+    
+    if BLOCKCHAIN_CONFIGURED:
+        # First node probe; later ones run in the background (is_blockchain_enabled)
+        await refresh_node_connection()
+        
+        # Pick up transactions submitted before the last shutdown
+        await resume_pending_chain_transactions()
     
     yield
     
     # Shutdown: Clean up resources
+    await confirmation_queue.stop()
+    await receipt_watcher.stop()
+    await close_async_session()
     await async_engine.dispose()
 
 
@@ -1,14 +1,14 @@
 """
 Business logic services for the secondary marketplace.
 """
-from datetime import datetime
 from typing import Optional
 import logging
 from fastapi import HTTPException
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update, case
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, contains_eager, aliased
 
+from app.db import upsert_insert
 from app.models import (
     User, Property, UserPropertyBalance, 
     MarketplaceListing, MarketplacePurchase
@@ -18,7 +18,9 @@ from app.schemas import (
     MarketplacePurchaseCreate, MarketplacePurchaseResponse,
     MarketplaceStats
 )
+from app.config import settings
 from app.services import get_user, get_property
+from app.blockchain.cache import TTLCache
 from app.blockchain.realestate1155 import transfer_tokens_custodial, BlockchainError
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,32 @@ logger = logging.getLogger(__name__)
 # Platform fee: 2.5%
 PLATFORM_FEE_PERCENT = 2.5
 
+# get_marketplace_stats result; dropped whenever listings or purchases change
+_stats_cache = TTLCache(maxsize=1, ttl=settings.MARKETPLACE_STATS_CACHE_TTL_SECONDS)
+STATS_CACHE_KEY = "marketplace:stats:v1"
+
+# get_marketplace_listing_details results, keyed f"listing:{id}"; dropped
+# when the listing is bought from or cancelled
+_listing_cache = TTLCache(maxsize=10_000, ttl=settings.LISTING_CACHE_TTL_SECONDS)
+
+
+def _add_tokens(db: AsyncSession, user_id: int, property_id: int, tokens: int):
+    """
+    Upsert adding `tokens` to a user's balance for a property.
+    
+    One INSERT ... ON CONFLICT DO UPDATE on (user_id, property_id), so the
+    increment is atomic and needs no prior SELECT.
+    """
+    stmt = upsert_insert(db, UserPropertyBalance).values(
+        user_id=user_id,
+        property_id=property_id,
+        tokens=tokens
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=["user_id", "property_id"],
+        set_={"tokens": UserPropertyBalance.tokens + stmt.excluded.tokens}
+    )
+
 
 async def create_marketplace_listing(
     db: AsyncSession, 
@@ -89,13 +117,12 @@ async def create_marketplace_listing(
             tokens_listed=listing_create.tokens,
             tokens_remaining=listing_create.tokens,
             price_per_token_usd=listing_create.price_per_token_usd,
-            status="active",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            status="active"
         )
         db.add(listing)
     
     await db.commit()
+    _stats_cache.invalidate(STATS_CACHE_KEY)
     await db.refresh(listing)
     
     # Eagerly load property relationship
@@ -142,6 +169,62 @@ async def get_marketplace_listing(db: AsyncSession, listing_id: int) -> Marketpl
     return listing
 
 
+async def get_marketplace_listing_details(
+    db: AsyncSession,
+    listing_id: int
+) -> MarketplaceListingWithDetails:
+    """
+    Get a marketplace listing with property details, served from a short
+    TTL cache.
+    
+    Args:
+        db: Database session
+        listing_id: Listing ID
+        
+    Returns:
+        Listing with property details
+        
+    Raises:
+        HTTPException: If listing not found
+    """
+    key = f"listing:{listing_id}"
+    details = _listing_cache.get(key)
+    if details is None:
+        # Not stored if a purchase or cancel invalidates while this reads
+        generation = _listing_cache.generation
+        listing = await get_marketplace_listing(db, listing_id)
+        details = _listing_details(listing)
+        _listing_cache.set(key, details, generation)
+    return details
+
+
+def _listing_details(listing: MarketplaceListing) -> MarketplaceListingWithDetails:
+    """Build the detailed response for a listing loaded with its property."""
+    # Calculate discount/premium vs original price
+    original_price = 1.0  # 1 token = $1 originally
+    price = listing.price_per_token_usd
+    discount_percent = ((original_price - price) / original_price) * 100 if price != original_price else None
+    
+    property_obj = listing.property
+    return MarketplaceListingWithDetails(
+        id=listing.id,
+        seller_id=listing.seller_id,
+        property_id=listing.property_id,
+        property_name=property_obj.name,
+        property_location=property_obj.location,
+        property_image_url=property_obj.image_url,
+        expected_annual_yield_percent=property_obj.expected_annual_yield_percent,
+        tokens_listed=listing.tokens_listed,
+        tokens_remaining=listing.tokens_remaining,
+        price_per_token_usd=price,
+        original_price_per_token_usd=original_price,
+        discount_percent=discount_percent,
+        status=listing.status,
+        created_at=listing.created_at,
+        updated_at=listing.updated_at
+    )
+
+
 async def list_marketplace_listings(
     db: AsyncSession,
     property_id: Optional[int] = None,
@@ -176,38 +259,9 @@ async def list_marketplace_listings(
         query = query.where(MarketplaceListing.status == status)
     
     result = await db.execute(query)
-    listings = list(result.scalars().all())
     
     # Build detailed response with property info
-    detailed_listings = []
-    for listing in listings:
-        # Calculate discount/premium vs original price
-        original_price = 1.0  # 1 token = $1 originally
-        discount_percent = None
-        if listing.price_per_token_usd != original_price:
-            discount_percent = ((original_price - listing.price_per_token_usd) / original_price) * 100
-        
-        detailed_listings.append(
-            MarketplaceListingWithDetails(
-                id=listing.id,
-                seller_id=listing.seller_id,
-                property_id=listing.property_id,
-                property_name=listing.property.name,
-                property_location=listing.property.location,
-                property_image_url=listing.property.image_url,
-                expected_annual_yield_percent=listing.property.expected_annual_yield_percent,
-                tokens_listed=listing.tokens_listed,
-                tokens_remaining=listing.tokens_remaining,
-                price_per_token_usd=listing.price_per_token_usd,
-                original_price_per_token_usd=original_price,
-                discount_percent=discount_percent,
-                status=listing.status,
-                created_at=listing.created_at,
-                updated_at=listing.updated_at
-            )
-        )
-    
-    return detailed_listings
+    return [_listing_details(listing) for listing in result.scalars()]
 
 
 async def purchase_from_marketplace(
@@ -242,8 +296,24 @@ async def purchase_from_marketplace(
     
     # Use transaction for atomicity
     async with db.begin_nested():
-        # Fetch listing with property
-        listing = await get_marketplace_listing(db, purchase_create.listing_id)
+        # Fetch listing with property, seller and buyer in one query
+        seller_user = aliased(User)
+        buyer_user = aliased(User)
+        result = await db.execute(
+            select(MarketplaceListing, seller_user, buyer_user)
+            .join(MarketplaceListing.property)
+            .options(contains_eager(MarketplaceListing.property))
+            .outerjoin(seller_user, seller_user.id == MarketplaceListing.seller_id)
+            .outerjoin(buyer_user, buyer_user.id == purchase_create.buyer_id)
+            .where(MarketplaceListing.id == purchase_create.listing_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Listing {purchase_create.listing_id} not found"
+            )
+        listing, seller, buyer = row
         
         # Validate listing
         if listing.status != "active":
@@ -263,9 +333,17 @@ async def purchase_from_marketplace(
         if purchase_create.buyer_id == listing.seller_id:
             raise HTTPException(status_code=400, detail="Cannot buy your own listing")
         
-        # Fetch buyer and seller
-        buyer = await get_user(db, purchase_create.buyer_id)
-        seller = await get_user(db, listing.seller_id)
+        # Verify buyer and seller exist
+        if buyer is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"User with id {purchase_create.buyer_id} not found"
+            )
+        if seller is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"User with id {listing.seller_id} not found"
+            )
         
         # Calculate prices
         total_price = purchase_create.tokens * listing.price_per_token_usd
@@ -280,37 +358,60 @@ async def purchase_from_marketplace(
                        f"Available: ${buyer.mock_balance_usd:.2f}"
             )
         
-        # Transfer money
-        buyer.mock_balance_usd -= total_price
-        seller.mock_balance_usd += seller_receives
-        buyer.updated_at = datetime.utcnow()
-        seller.updated_at = datetime.utcnow()
-        
-        # Transfer tokens to buyer
+        # Update listing; the guard fails if a concurrent purchase or
+        # cancellation got there first
+        tokens = purchase_create.tokens
         result = await db.execute(
-            select(UserPropertyBalance).where(
-                UserPropertyBalance.user_id == purchase_create.buyer_id,
-                UserPropertyBalance.property_id == listing.property_id
+            update(MarketplaceListing)
+            .where(
+                MarketplaceListing.id == listing.id,
+                MarketplaceListing.status == "active",
+                MarketplaceListing.tokens_remaining >= tokens
+            )
+            .values(
+                tokens_remaining=MarketplaceListing.tokens_remaining - tokens,
+                status=case(
+                    (MarketplaceListing.tokens_remaining == tokens, "completed"),
+                    else_=MarketplaceListing.status
+                )
             )
+            .returning(MarketplaceListing.status)
         )
-        buyer_balance = result.scalar_one_or_none()
+        listing_status = result.scalar_one_or_none()
+        if listing_status is None:
+            raise HTTPException(
+                status_code=400,
+                detail="Listing changed during purchase, please retry"
+            )
         
-        if buyer_balance:
-            buyer_balance.tokens += purchase_create.tokens
-        else:
-            buyer_balance = UserPropertyBalance(
-                user_id=purchase_create.buyer_id,
-                property_id=listing.property_id,
-                tokens=purchase_create.tokens
+        # Transfer money; the buyer's balance is re-checked in the UPDATE
+        result = await db.execute(
+            update(User)
+            .where(User.id == buyer.id, User.mock_balance_usd >= total_price)
+            .values(mock_balance_usd=User.mock_balance_usd - total_price)
+            .returning(User.mock_balance_usd)
+        )
+        buyer_new_balance = result.scalar_one_or_none()
+        if buyer_new_balance is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Insufficient balance. Required: ${total_price:.2f}"
             )
-            db.add(buyer_balance)
         
-        # Update listing
-        listing.tokens_remaining -= purchase_create.tokens
-        listing.updated_at = datetime.utcnow()
+        result = await db.execute(
+            update(User)
+            .where(User.id == seller.id)
+            .values(mock_balance_usd=User.mock_balance_usd + seller_receives)
+            .returning(User.mock_balance_usd)
+        )
+        seller_new_balance = result.scalar_one()
         
-        if listing.tokens_remaining == 0:
-            listing.status = "completed"
+        # Transfer tokens to buyer
+        result = await db.execute(
+            _add_tokens(db, purchase_create.buyer_id, listing.property_id, tokens)
+            .returning(UserPropertyBalance.tokens)
+        )
+        buyer_token_balance = result.scalar_one()
         
         # Create purchase record
         purchase = MarketplacePurchase(
@@ -322,18 +423,16 @@ async def purchase_from_marketplace(
             price_per_token_usd=listing.price_per_token_usd,
             total_price_usd=total_price,
             platform_fee_usd=platform_fee,
-            seller_received_usd=seller_receives,
-            created_at=datetime.utcnow()
+            seller_received_usd=seller_receives
         )
         db.add(purchase)
     
-    # Commit database transaction first
+    # Commit database transaction first. Sessions don't expire on commit,
+    # the flush filled in the purchase id and timestamp and the new balances
+    # came back via RETURNING, so nothing needs refreshing.
     await db.commit()
-    await db.refresh(purchase)
-    await db.refresh(buyer)
-    await db.refresh(seller)
-    await db.refresh(buyer_balance)
-    await db.refresh(listing)
+    _stats_cache.invalidate(STATS_CACHE_KEY)
+    _listing_cache.invalidate(f"listing:{purchase_create.listing_id}")
     
     # Now execute blockchain transfer (after DB commit)
     property_obj = listing.property
@@ -380,10 +479,10 @@ async def purchase_from_marketplace(
     
     return MarketplacePurchaseResponse(
         purchase=purchase,
-        buyer_new_balance_usd=buyer.mock_balance_usd,
-        seller_new_balance_usd=seller.mock_balance_usd,
-        buyer_new_token_balance=buyer_balance.tokens,
-        listing_status=listing.status
+        buyer_new_balance_usd=buyer_new_balance,
+        seller_new_balance_usd=seller_new_balance,
+        buyer_new_token_balance=buyer_token_balance,
+        listing_status=listing_status
     )
 
 
@@ -421,31 +520,34 @@ async def cancel_marketplace_listing(
                 detail=f"Cannot cancel listing with status: {listing.status}"
             )
         
-        # Return remaining tokens to seller
+        # Cancel the listing; the guard fails if a concurrent purchase or
+        # cancellation got there first, and RETURNING gives the tokens
+        # still listed as of the cancellation
         result = await db.execute(
-            select(UserPropertyBalance).where(
-                UserPropertyBalance.user_id == listing.seller_id,
-                UserPropertyBalance.property_id == listing.property_id
+            update(MarketplaceListing)
+            .where(
+                MarketplaceListing.id == listing_id,
+                MarketplaceListing.status == "active"
             )
+            .values(status="cancelled")
+            .returning(MarketplaceListing.tokens_remaining)
         )
-        balance = result.scalar_one_or_none()
-        
-        if balance:
-            balance.tokens += listing.tokens_remaining
-        else:
-            # Shouldn't happen, but handle gracefully
-            balance = UserPropertyBalance(
-                user_id=listing.seller_id,
-                property_id=listing.property_id,
-                tokens=listing.tokens_remaining
+        tokens_remaining = result.scalar_one_or_none()
+        if tokens_remaining is None:
+            raise HTTPException(
+                status_code=400,
+                detail="Listing changed during cancellation, please retry"
             )
-            db.add(balance)
         
-        # Update listing
-        listing.status = "cancelled"
-        listing.updated_at = datetime.utcnow()
+        # Return remaining tokens to seller (recreates the balance row if
+        # it is missing, which shouldn't happen)
+        await db.execute(
+            _add_tokens(db, listing.seller_id, listing.property_id, tokens_remaining)
+        )
     
     await db.commit()
+    _stats_cache.invalidate(STATS_CACHE_KEY)
+    _listing_cache.invalidate(f"listing:{listing_id}")
     
     # Eagerly load property relationship
     result = await db.execute(
@@ -473,48 +575,36 @@ async def get_marketplace_stats(db: AsyncSession) -> MarketplaceStats:
     Returns:
         MarketplaceStats with aggregated data
     """
-    # Count active listings
-    active_count_result = await db.execute(
-        select(func.count(MarketplaceListing.id)).where(
-            MarketplaceListing.status == "active"
-        )
-    )
-    active_count = active_count_result.scalar() or 0
-    
-    # Sum tokens listed
-    tokens_listed_result = await db.execute(
-        select(func.sum(MarketplaceListing.tokens_remaining)).where(
-            MarketplaceListing.status == "active"
-        )
-    )
-    tokens_listed = tokens_listed_result.scalar() or 0
+    stats = _stats_cache.get(STATS_CACHE_KEY)
+    if stats is not None:
+        return stats
+    generation = _stats_cache.generation
     
-    # Calculate total trading volume
-    volume_result = await db.execute(
-        select(func.sum(MarketplacePurchase.total_price_usd))
-    )
-    total_volume = volume_result.scalar() or 0.0
-    
-    # Calculate average discount
-    listings_result = await db.execute(
-        select(MarketplaceListing.price_per_token_usd).where(
-            MarketplaceListing.status == "active"
-        )
+    # Active listing aggregates and total trading volume in one query
+    result = await db.execute(
+        select(
+            func.count(MarketplaceListing.id),
+            func.sum(MarketplaceListing.tokens_remaining),
+            func.avg(MarketplaceListing.price_per_token_usd),
+            select(func.sum(MarketplacePurchase.total_price_usd)).scalar_subquery()
+        ).where(MarketplaceListing.status == "active")
     )
-    prices = list(listings_result.scalars().all())
+    active_count, tokens_listed, avg_price, total_volume = result.one()
     
+    # Average discount vs the original $1/token price
     avg_discount = None
-    if prices:
+    if avg_price is not None:
         original_price = 1.0
-        discounts = [((original_price - price) / original_price) * 100 for price in prices]
-        avg_discount = sum(discounts) / len(discounts)
+        avg_discount = ((original_price - avg_price) / original_price) * 100
     
-    return MarketplaceStats(
+    stats = MarketplaceStats(
         total_active_listings=active_count,
-        total_tokens_listed=tokens_listed,
-        total_volume_usd=total_volume,
+        total_tokens_listed=tokens_listed or 0,
+        total_volume_usd=total_volume or 0.0,
         average_discount_percent=avg_discount
     )
+    _stats_cache.set(STATS_CACHE_KEY, stats, generation)
+    return stats
 
 
 async def get_user_marketplace_purchases(
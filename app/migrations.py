@@ -0,0 +1,190 @@
+"""
+Startup schema upgrades.
+
+create_all only creates missing tables. Databases created by an earlier
+version also need the tables, columns and triggers added since, with
+the data derived from them backfilled. Every step checks what exists
+first, so upgrade_schema is safe to run on each startup.
+"""
+import logging
+
+from sqlalchemy import func, insert, inspect, select, text, update
+
+from app.db import Base
+from app.models import DaoProposal, DaoProposalTally, DaoVote
+
+logger = logging.getLogger(__name__)
+
+
+def upgrade_schema(conn, create_tables: bool) -> None:
+    """
+    Create missing tables (if create_tables) and upgrade existing ones.
+    
+    Run through AsyncConnection.run_sync, inside one transaction. The
+    tally trigger is created here rather than by create_all, so it also
+    exists where AUTO_CREATE_TABLES is off.
+    
+    Args:
+        conn: Database connection
+        create_tables: Run create_all first (settings.AUTO_CREATE_TABLES)
+    """
+    existing = set(inspect(conn).get_table_names())
+    if create_tables:
+        Base.metadata.create_all(conn)
+    
+    if "dao_proposals" in existing:
+        _upgrade_dao_proposals(conn)
+    _create_missing_indexes(conn, existing)
+    _drop_removed_indexes(conn)
+    # Checked again, as create_all may just have created it
+    if inspect(conn).has_table("dao_votes"):
+        _upgrade_dao_tallies(conn, existing)
+        _backfill_winning_options(conn)
+
+
+def _add_column(conn, table: str, column: str, definition: str) -> bool:
+    """ALTER TABLE ADD COLUMN unless `table` has `column`; True if it was added."""
+    if column in {c["name"] for c in inspect(conn).get_columns(table)}:
+        return False
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}"))
+    logger.info("Added column %s.%s", table, column)
+    return True
+
+
+def _create_missing_indexes(conn, existing: set) -> None:
+    """Create the indexes added to tables that already existed."""
+    for table in Base.metadata.sorted_tables:
+        if table.name in existing:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+
+# Indexes earlier versions created that the models no longer define
+_REMOVED_INDEXES = [
+    # Covered by the leading column of uix_user_property
+    "ix_user_property_balances_user_id",
+]
+
+
+def _drop_removed_indexes(conn) -> None:
+    """Drop the indexes removed from the models since the tables were created."""
+    for index in _REMOVED_INDEXES:
+        conn.execute(text(f"DROP INDEX IF EXISTS {index}"))
+
+
+def _upgrade_dao_proposals(conn) -> None:
+    """Add the dao_proposals columns introduced since the table was created."""
+    # Optimistic lock counter; existing rows start at 0 like new ones
+    _add_column(conn, "dao_proposals", "version", "INTEGER NOT NULL DEFAULT 0")
+    # Winning option of approved proposals, backfilled from the tallies
+    _add_column(conn, "dao_proposals", "winning_option_index", "INTEGER")
+    # Option count for vote bounds checks, filled in from options_json
+    if _add_column(conn, "dao_proposals", "num_options", "INTEGER NOT NULL DEFAULT 0"):
+        conn.execute(
+            update(DaoProposal).values(
+                num_options=func.json_array_length(DaoProposal.options_json),
+                updated_at=DaoProposal.updated_at
+            )
+        )
+    
+    # Draft vs. active now follows from start_at on read (current_status),
+    # so proposals stored as draft are stored as active like new ones
+    conn.execute(
+        update(DaoProposal)
+        .where(DaoProposal.status == "draft")
+        .values(status="active", updated_at=DaoProposal.updated_at)
+    )
+
+
+# Adds each inserted vote's weight to its option's tally, inside the
+# inserting transaction
+_TALLY_TRIGGER_DDL = {
+    "sqlite": [
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_dao_votes_tally
+        AFTER INSERT ON dao_votes
+        BEGIN
+            INSERT INTO dao_proposal_tallies (proposal_id, option_index, weight_tokens)
+            VALUES (NEW.proposal_id, NEW.selected_option_index, NEW.weight_tokens)
+            ON CONFLICT (proposal_id, option_index)
+            DO UPDATE SET weight_tokens = weight_tokens + excluded.weight_tokens;
+        END
+        """,
+    ],
+    "postgresql": [
+        """
+        CREATE OR REPLACE FUNCTION dao_votes_tally() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO dao_proposal_tallies (proposal_id, option_index, weight_tokens)
+            VALUES (NEW.proposal_id, NEW.selected_option_index, NEW.weight_tokens)
+            ON CONFLICT (proposal_id, option_index)
+            DO UPDATE SET weight_tokens = dao_proposal_tallies.weight_tokens + EXCLUDED.weight_tokens;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        "DROP TRIGGER IF EXISTS trg_dao_votes_tally ON dao_votes",
+        """
+        CREATE TRIGGER trg_dao_votes_tally
+        AFTER INSERT ON dao_votes
+        FOR EACH ROW EXECUTE FUNCTION dao_votes_tally()
+        """,
+    ],
+}
+
+
+def _upgrade_dao_tallies(conn, existing: set) -> None:
+    """
+    Create dao_proposal_tallies and the dao_votes trigger that maintains it.
+    
+    A newly created tally table is filled from the votes cast before it
+    existed. The trigger is (re)created first, so on databases with
+    transactional DDL no vote can slip in between the two.
+    """
+    statements = _TALLY_TRIGGER_DDL.get(conn.dialect.name)
+    if statements is None:
+        raise RuntimeError(f"No dao_votes tally trigger for the {conn.dialect.name} dialect")
+    
+    created = "dao_proposal_tallies" not in existing
+    DaoProposalTally.__table__.create(conn, checkfirst=True)
+    for statement in statements:
+        conn.execute(text(statement))
+    
+    if created:
+        conn.execute(
+            insert(DaoProposalTally).from_select(
+                ["proposal_id", "option_index", "weight_tokens"],
+                select(
+                    DaoVote.proposal_id,
+                    DaoVote.selected_option_index,
+                    func.sum(DaoVote.weight_tokens)
+                ).group_by(DaoVote.proposal_id, DaoVote.selected_option_index)
+            )
+        )
+        logger.info("Created dao_proposal_tallies from existing votes")
+
+
+def _backfill_winning_options(conn) -> None:
+    """
+    Store the winning option of proposals approved before it was stored
+    at approval, picked the same way (most votes, first on ties).
+    """
+    winning_option_index = (
+        select(DaoProposalTally.option_index)
+        .where(
+            DaoProposalTally.proposal_id == DaoProposal.id,
+            DaoProposalTally.weight_tokens > 0
+        )
+        .order_by(DaoProposalTally.weight_tokens.desc(), DaoProposalTally.option_index)
+        .limit(1)
+        .scalar_subquery()
+    )
+    conn.execute(
+        update(DaoProposal)
+        .where(
+            DaoProposal.status == "approved",
+            DaoProposal.winning_option_index.is_(None)
+        )
+        # updated_at doubles as the approval time, so keep it as is
+        .values(winning_option_index=winning_option_index, updated_at=DaoProposal.updated_at)
+    )
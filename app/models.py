@@ -2,11 +2,42 @@
 SQLAlchemy database models.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime, ForeignKey, UniqueConstraint, JSON
+from sqlalchemy import Column, Integer, String, Float, Text, DateTime, ForeignKey, UniqueConstraint, Index, JSON, case
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.sql.expression import FunctionElement
 from sqlalchemy.orm import relationship
 from app.db import Base
 
 
+class utcnow(FunctionElement):
+    """
+    Current UTC time computed by the database, as a naive timestamp.
+    
+    Rendered per dialect (see the compiles hooks below), so it can be used
+    in server defaults and queries on any backend.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    # The fixed-width format SQLAlchemy stores DateTime in on SQLite, so
+    # database- and Python-written timestamps sort and compare correctly
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
 class User(Base):
     """User model representing a platform user."""
     
@@ -103,7 +134,8 @@ class UserPropertyBalance(Base):
     __tablename__ = "user_property_balances"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    # Lookups by user (alone or with property) use the uix_user_property index
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     property_id = Column(Integer, ForeignKey("properties.id"), nullable=False, index=True)
     tokens = Column(Integer, nullable=False, default=0)
     
@@ -117,6 +149,20 @@ class UserPropertyBalance(Base):
     property = relationship("Property", back_populates="user_balances")
 
 
+class ChainTransaction(Base):
+    """Submitted on-chain transaction, confirmed in the background."""
+    
+    __tablename__ = "chain_transactions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    tx_hash = Column(String, unique=True, nullable=False, index=True)
+    kind = Column(String, nullable=False)  # e.g., "mint_to_user", "fund_wallet"
+    status = Column(String, nullable=False, default="submitted", index=True)  # "submitted", "confirmed", "failed", "timed_out", "dropped"
+    block_number = Column(Integer, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class DaoProposal(Base):
     """DAO Proposal model for property governance."""
     
@@ -128,18 +174,70 @@ class DaoProposal(Base):
     description = Column(Text, nullable=False)
     proposal_type = Column(String, nullable=False)  # e.g., "property_upgrade", "rent_adjustment", "general"
     options_json = Column(JSON, nullable=False)  # e.g., ["Yes", "No", "Abstain"]
+    num_options = Column(Integer, nullable=False)  # len(options_json), for bounds checks without decoding it
     min_quorum_percent = Column(Float, nullable=False, default=10.0)  # Minimum % of tokens that must vote
-    status = Column(String, nullable=False, default="draft")  # "draft", "active", "closed"
+    status = Column(String, nullable=False, default="active")  # Manual transitions only: "active", "closed", "approved"
+    winning_option_index = Column(Integer, nullable=True)  # Set on approval, index into options_json
     start_at = Column(DateTime, nullable=True)
     end_at = Column(DateTime, nullable=True)
     created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Set from the database clock. default puts it into the INSERT itself,
+    # so tables created before the server default existed get it too.
+    created_at = Column(DateTime, nullable=False, default=utcnow(), server_default=utcnow())
+    updated_at = Column(DateTime, nullable=False, default=utcnow(), server_default=utcnow(), onupdate=utcnow())
+    version = Column(Integer, nullable=False, default=0)  # Optimistic lock, bumped on every update
+    
+    # eager_defaults fetches the database-set timestamps back via RETURNING
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
+    
+    __table_args__ = (
+        # Backs the newest-first keyset pagination of proposal lists
+        Index("ix_dao_proposal_created_at_id", created_at.desc(), id.desc()),
+        # Approved rent decision lookup per property, latest first
+        Index("ix_dao_proposal_prop_type_status_updated", "property_id", "proposal_type", "status", "updated_at"),
+        # Open (draft or active) proposals per property, in list order
+        Index(
+            "ix_dao_proposal_property_active",
+            property_id,
+            created_at.desc(),
+            id.desc(),
+            sqlite_where=status == "active",
+            postgresql_where=status == "active"
+        ),
+    )
     
     # Relationships
     property = relationship("Property", back_populates="dao_proposals")
     creator = relationship("User", foreign_keys=[created_by_user_id])
     votes = relationship("DaoVote", back_populates="proposal", cascade="all, delete-orphan")
+    tallies = relationship("DaoProposalTally", cascade="all, delete-orphan")
+    
+    @hybrid_property
+    def current_status(self) -> str:
+        """
+        Status as of now: a closed or approved proposal keeps its status,
+        otherwise it is "draft" before start_at, "closed" from end_at on
+        and "active" in between.
+        """
+        if self.status in ("closed", "approved"):
+            return self.status
+        now = datetime.utcnow()
+        if self.start_at is not None and now < self.start_at:
+            return "draft"
+        if self.end_at is not None and now >= self.end_at:
+            return "closed"
+        return "active"
+    
+    @current_status.inplace.expression
+    @classmethod
+    def _current_status_expression(cls):
+        now = utcnow()
+        return case(
+            (cls.status.in_(("closed", "approved")), cls.status),
+            (cls.start_at > now, "draft"),
+            (cls.end_at <= now, "closed"),
+            else_="active"
+        )
 
 
 class DaoVote(Base):
@@ -152,7 +250,7 @@ class DaoVote(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     selected_option_index = Column(Integer, nullable=False)  # Index into options_json array
     weight_tokens = Column(Integer, nullable=False)  # User's token balance at time of vote
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=utcnow(), server_default=utcnow())  # Database clock, as on DaoProposal
     
     # Unique constraint: one vote per user per proposal
     __table_args__ = (
@@ -164,6 +262,22 @@ class DaoVote(Base):
     user = relationship("User")
 
 
+class DaoProposalTally(Base):
+    """Running vote weight per proposal option, maintained by a trigger on dao_votes (see app.migrations)."""
+    
+    __tablename__ = "dao_proposal_tallies"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    proposal_id = Column(Integer, ForeignKey("dao_proposals.id"), nullable=False, index=True)
+    option_index = Column(Integer, nullable=False)  # Index into options_json array
+    weight_tokens = Column(Integer, nullable=False, default=0)  # Sum of vote weights for this option
+    
+    # Unique constraint: one tally row per option
+    __table_args__ = (
+        UniqueConstraint("proposal_id", "option_index", name="uix_proposal_option"),
+    )
+
+
 class MarketplaceListing(Base):
     """Marketplace listing for secondary token sales."""
     
@@ -179,6 +293,23 @@ class MarketplaceListing(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        # Active listings newest first (browse, stats), overall and per property
+        Index(
+            "ix_marketplace_active",
+            created_at.desc(),
+            sqlite_where=status == "active",
+            postgresql_where=status == "active"
+        ),
+        Index(
+            "ix_marketplace_active_property",
+            property_id,
+            created_at.desc(),
+            sqlite_where=status == "active",
+            postgresql_where=status == "active"
+        ),
+    )
+    
     # Relationships
     seller = relationship("User", foreign_keys=[seller_id])
     property = relationship("Property")
@@ -1,17 +1,20 @@
 """Blockchain integration endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import logging
 
 from app.db import get_db
 from app.models import Property
-from app.schemas import PropertyOnChainStatus, OnChainPropertyInfo
+from app.schemas import PropertyOnChainStatus, OnChainPropertyInfo, ChainTransactionRead
+from app.services import get_chain_transaction
 from app.blockchain.realestate1155 import (
     create_property_contract_via_factory,
     get_property_on_chain,
     BlockchainError
 )
+from app.blockchain.multicall import get_properties_bulk
 from app.blockchain.client import (
     is_blockchain_enabled,
     get_blockchain_status
@@ -22,7 +25,15 @@ logger = logging.getLogger(__name__)
 
 @router.get("/status")
 async def blockchain_status():
-    return get_blockchain_status()
+    return await get_blockchain_status()
+
+@router.get("/transactions/{tx_hash}", response_model=ChainTransactionRead)
+async def get_transaction_status(
+    tx_hash: str,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get the confirmation status of a submitted transaction."""
+    return await get_chain_transaction(db, tx_hash)
 
 @router.post("/properties/{property_id}/create-onchain")
 async def create_property_onchain_endpoint(
@@ -77,6 +88,60 @@ async def create_property_onchain_endpoint(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Blockchain error: {str(e)}")
 
+def _onchain_status(property: Property, onchain_info) -> PropertyOnChainStatus:
+    """Combine a property's backend row with its on-chain info (None if unavailable)."""
+    backend_data = {
+        "total_tokens": property.total_tokens,
+        "tokens_sold": property.tokens_sold,
+        "status": property.status,
+        "token_contract_address": property.token_contract_address,
+        "chain_name": property.chain_name
+    }
+    
+    onchain_data = None
+    if onchain_info:
+        onchain_data = OnChainPropertyInfo(
+            contract_address=property.token_contract_address,
+            total_tokens=onchain_info["total_tokens"],
+            tokens_minted=onchain_info["tokens_minted"],
+            is_active=onchain_info["is_active"],
+            is_funded=onchain_info["is_funded"]
+        )
+    
+    return PropertyOnChainStatus(
+        property_id=property.id,
+        backend=backend_data,
+        onchain=onchain_data
+    )
+
+@router.get("/properties/onchain-status", response_model=List[PropertyOnChainStatus])
+async def list_properties_onchain_status(
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Backend and on-chain status of a page of properties.
+    
+    The contracts are read through Multicall3 in one eth_call, so every
+    on-chain result comes from the same block.
+    """
+    result = await db.execute(
+        select(Property)
+        .order_by(Property.id)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )
+    properties = list(result.scalars().all())
+    
+    deployed = [p for p in properties if p.token_contract_address]
+    onchain_infos = {}
+    if deployed and is_blockchain_enabled():
+        infos = await get_properties_bulk([p.token_contract_address for p in deployed])
+        onchain_infos = {p.id: info for p, info in zip(deployed, infos)}
+    
+    return [_onchain_status(p, onchain_infos.get(p.id)) for p in properties]
+
 @router.get("/properties/{property_id}/onchain-status", response_model=PropertyOnChainStatus)
 async def get_property_onchain_status(
     property_id: int,
@@ -89,33 +154,11 @@ async def get_property_onchain_status(
     if not property:
         raise HTTPException(status_code=404, detail="Property not found")
     
-    backend_data = {
-        "total_tokens": property.total_tokens,
-        "tokens_sold": property.tokens_sold,
-        "status": property.status,
-        "token_contract_address": property.token_contract_address,
-        "chain_name": property.chain_name
-    }
-    
-    onchain_data = None
+    onchain_info = None
     if property.token_contract_address and is_blockchain_enabled():
         try:
-        
-            onchain_info = get_property_on_chain(property.token_contract_address)
-            if onchain_info:
-                onchain_data = OnChainPropertyInfo(
-                    contract_address=property.token_contract_address,
-                    total_tokens=onchain_info["total_tokens"],
-                    tokens_minted=onchain_info["tokens_minted"],
-                    is_active=onchain_info["is_active"],
-                    is_funded=onchain_info["is_funded"]
-                )
+            onchain_info = await get_property_on_chain(property.token_contract_address)
         except Exception as e:
             logger.error(f"Error fetching on-chain data: {e}")
-            onchain_data = None
     
-    return PropertyOnChainStatus(
-        property_id=property_id,
-        backend=backend_data,
-        onchain=onchain_data
-    )
\ No newline at end of file
+    return _onchain_status(property, onchain_info)
@@ -1,7 +1,7 @@
 """
 DAO Governance Router - Token-weighted off-chain voting endpoints.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
@@ -9,14 +9,17 @@ from app.db import get_db
 from app.schemas import (
     DaoProposalCreate,
     DaoProposalRead,
+    DaoProposalReadWithResults,
     DaoVoteCreate,
     DaoVoteRead,
-    DaoProposalResult
+    DaoProposalResult,
+    NaiveUtcDatetime
 )
 from app.dao_services import (
     create_dao_proposal,
     get_proposal,
     get_property_proposals,
+    get_property_proposals_with_results,
     cast_vote,
     compute_proposal_results,
     close_proposal
@@ -25,6 +28,15 @@ from app.dao_services import (
 router = APIRouter()
 
 
+def _check_cursor(after_created_at, after_id) -> None:
+    """Reject a half-given page cursor, which would silently return page 1 again."""
+    if (after_created_at is None) != (after_id is None):
+        raise HTTPException(
+            status_code=400,
+            detail="after_created_at and after_id must be given together"
+        )
+
+
 @router.post("/proposals", response_model=DaoProposalRead, status_code=201)
 async def create_proposal_endpoint(
     proposal_create: DaoProposalCreate,
@@ -46,33 +58,64 @@ async def create_proposal_endpoint(
 async def get_all_proposals_endpoint(
     user_id: Optional[int] = None,
     status: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    after_created_at: Optional[NaiveUtcDatetime] = None,
+    after_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Get all proposals, optionally filtered by user or status.
+    Get proposals, newest first, optionally filtered by user or status.
     
     Optional query params:
     - user_id: Filter proposals created by this user
     - status: Filter by status ("draft", "active", "closed")
+    - limit: Page size (default 50)
+    - after_created_at, after_id: Cursor from the last proposal of the previous page
     """
+    _check_cursor(after_created_at, after_id)
     from app.dao_services import get_all_proposals
-    proposals = await get_all_proposals(db, user_id, status)
+    proposals = await get_all_proposals(db, user_id, status, limit, after_created_at, after_id)
     return proposals
 
 
-@router.get("/properties/{property_id}/proposals", response_model=list[DaoProposalRead])
+@router.get(
+    "/properties/{property_id}/proposals",
+    response_model=list[DaoProposalReadWithResults],
+    response_model_exclude_unset=True
+)
 async def get_property_proposals_endpoint(
     property_id: int,
     status: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    after_created_at: Optional[NaiveUtcDatetime] = None,
+    after_id: Optional[int] = None,
+    include_results: bool = False,
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Get all proposals for a property.
+    Get proposals for a property, newest first.
     
-    Optional query param:
+    Optional query params:
     - status: Filter by status ("draft", "active", "closed")
+    - limit: Page size (default 50)
+    - after_created_at, after_id: Cursor from the last proposal of the previous page
+    - include_results: Also return each proposal's voting results
     """
-    proposals = await get_property_proposals(db, property_id, status)
+    _check_cursor(after_created_at, after_id)
+    if include_results:
+        rows = await get_property_proposals_with_results(
+            db, property_id, status, limit, after_created_at, after_id
+        )
+        return [
+            DaoProposalReadWithResults.model_validate(proposal).model_copy(
+                update={"voting_results": results}
+            )
+            for proposal, results in rows
+        ]
+    
+    proposals = await get_property_proposals(
+        db, property_id, status, limit, after_created_at, after_id
+    )
     return proposals
 
 
@@ -160,18 +203,24 @@ async def approve_proposal_endpoint(
 @router.get("/rent-proposals", response_model=list[DaoProposalRead])
 async def get_rent_proposals_endpoint(
     status: Optional[str] = "closed",
+    limit: int = Query(50, ge=1, le=200),
+    after_created_at: Optional[NaiveUtcDatetime] = None,
+    after_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Get all rent decision proposals.
+    Get rent decision proposals, newest first.
     
     Query parameters:
     - status: Filter by status (default: "closed" to show decided proposals)
+    - limit: Page size (default 50)
+    - after_created_at, after_id: Cursor from the last proposal of the previous page
     
     Returns proposals of type "rent_decision" that need admin action.
     """
+    _check_cursor(after_created_at, after_id)
     from app.dao_services import get_rent_proposals
-    proposals = await get_rent_proposals(db, status)
+    proposals = await get_rent_proposals(db, status, limit, after_created_at, after_id)
     return proposals
 
 
@@ -190,6 +239,24 @@ async def get_property_rent_status_endpoint(
     return status
 
 
+@router.get("/rent-statuses")
+async def get_rent_statuses_endpoint(
+    property_ids: list[int] = Query(...),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the rental status of several properties at once (e.g. dashboards).
+    
+    Query parameters:
+    - property_ids: Property IDs (repeat the parameter for each)
+    
+    Returns a mapping of property ID to its rent status.
+    """
+    from app.dao_services import get_rent_statuses_bulk
+    statuses = await get_rent_statuses_bulk(db, property_ids)
+    return statuses
+
+
 @router.get("/properties/{property_id}/users/{user_id}/rent-payout")
 async def get_user_rent_payout_endpoint(
     property_id: int,
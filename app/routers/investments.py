@@ -8,8 +8,8 @@ import logging
 from app.db import get_db
 from app.models import Property, User
 from app.schemas import InvestmentCreate, InvestmentRead, InvestmentResponse
-from app.services import invest_in_property, list_investments, ensure_user_wallet
-from app.blockchain.realestate1155 import mint_to_user, BlockchainError
+from app.services import invest_in_property, list_investments, ensure_user_wallet, track_chain_transaction
+from app.blockchain.realestate1155 import submit_mint_to_user, BlockchainError
 from app.blockchain.client import is_blockchain_enabled
 
 router = APIRouter()
@@ -26,8 +26,9 @@ async def buy_tokens_endpoint(
     Flow:
     1. Validate user and property
     2. Process investment in database (user pays via card/bank)
-    3. Mint tokens directly to user's wallet on blockchain
-    4. Return response with transaction hash
+    3. Submit a mint of the tokens directly to user's wallet on blockchain
+    4. Return response with transaction hash (confirmed in the background,
+       see GET /api/blockchain/transactions/{tx_hash})
     """
     user_result = await db.execute(select(User).where(User.id == investment_create.user_id))
     user = user_result.scalar_one_or_none()
@@ -42,12 +43,13 @@ async def buy_tokens_endpoint(
     chain_tx_hash = None
     if is_blockchain_enabled() and property and property.token_contract_address and user and user.blockchain_address:
         try:
-            chain_tx_hash = await mint_to_user(
+            chain_tx_hash = await submit_mint_to_user(
                 contract_address=property.token_contract_address,
                 to_address=user.blockchain_address,
                 amount=investment_create.tokens
             )
-            logger.info(f"✅ Blockchain mint successful: {chain_tx_hash}")
+            await track_chain_transaction(db, chain_tx_hash, "mint_to_user")
+            logger.info(f"✅ Blockchain mint submitted: {chain_tx_hash}")
         except BlockchainError as e:
         
             logger.error(f"⚠️ Blockchain mint failed (non-fatal): {e}")
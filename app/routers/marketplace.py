@@ -12,7 +12,7 @@ from app.schemas import (
     MarketplaceStats
 )
 from app.marketplace_services import (
-    create_marketplace_listing, get_marketplace_listing,
+    create_marketplace_listing, get_marketplace_listing_details,
     list_marketplace_listings, purchase_from_marketplace,
     cancel_marketplace_listing, get_marketplace_stats,
     get_user_marketplace_purchases, get_user_marketplace_sales
@@ -94,31 +94,7 @@ async def get_listing(
     **Returns:**
     Full listing details with property information.
     """
-    listing = await get_marketplace_listing(db, listing_id)
-    
-    # Calculate discount
-    original_price = 1.0
-    discount_percent = None
-    if listing.price_per_token_usd != original_price:
-        discount_percent = ((original_price - listing.price_per_token_usd) / original_price) * 100
-    
-    return MarketplaceListingWithDetails(
-        id=listing.id,
-        seller_id=listing.seller_id,
-        property_id=listing.property_id,
-        property_name=listing.property.name,
-        property_location=listing.property.location,
-        property_image_url=listing.property.image_url,
-        expected_annual_yield_percent=listing.property.expected_annual_yield_percent,
-        tokens_listed=listing.tokens_listed,
-        tokens_remaining=listing.tokens_remaining,
-        price_per_token_usd=listing.price_per_token_usd,
-        original_price_per_token_usd=original_price,
-        discount_percent=discount_percent,
-        status=listing.status,
-        created_at=listing.created_at,
-        updated_at=listing.updated_at
-    )
+    return await get_marketplace_listing_details(db, listing_id)
 
 
 @router.post("/buy", response_model=MarketplacePurchaseResponse)
@@ -1,9 +1,34 @@
 """
 Pydantic schemas for request/response validation.
 """
-from datetime import datetime
-from typing import Optional, Any
-from pydantic import BaseModel, EmailStr, ConfigDict
+from datetime import datetime, timezone
+from typing import Optional, Any, Annotated
+from pydantic import BaseModel, EmailStr, ConfigDict, AfterValidator, AliasChoices, Field
+from web3 import Web3
+
+
+def _checksum_address(value: str) -> str:
+    """Validate an address and return its EIP-55 checksum form."""
+    if not Web3.is_address(value):
+        raise ValueError("Invalid blockchain address")
+    return Web3.to_checksum_address(value)
+
+
+# Address normalized once at the API boundary, so it is stored checksummed
+# and the transaction paths can use it as-is
+ChecksumAddress = Annotated[str, AfterValidator(_checksum_address)]
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Convert an aware datetime to naive UTC; naive values are assumed UTC."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# Datetime normalized once at the API boundary to naive UTC, the form
+# stored in SQLite and compared against datetime.utcnow()
+NaiveUtcDatetime = Annotated[datetime, AfterValidator(_naive_utc)]
 
 
 # ==================== User Schemas ====================
@@ -34,7 +59,7 @@ class UserRead(BaseModel):
 
 class UserWalletUpdate(BaseModel):
     """Schema for updating user's blockchain wallet address."""
-    blockchain_wallet_address: str
+    blockchain_wallet_address: ChecksumAddress
 
 
 class UserWalletInfo(BaseModel):
@@ -138,7 +163,7 @@ class PropertyRead(BaseModel):
 
 class PropertyOnchainUpdate(BaseModel):
     """Schema for updating property's blockchain contract details."""
-    token_contract_address: str
+    token_contract_address: ChecksumAddress
     chain_name: Optional[str] = "base"
 
 
@@ -225,6 +250,18 @@ class PropertyOnChainStatus(BaseModel):
     onchain: Optional[OnChainPropertyInfo] = None
 
 
+class ChainTransactionRead(BaseModel):
+    """Status of a submitted on-chain transaction."""
+    tx_hash: str
+    kind: str
+    status: str
+    block_number: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
 # ==================== DAO Governance Schemas ====================
 
 class DaoProposalBase(BaseModel):
@@ -240,8 +277,8 @@ class DaoProposalBase(BaseModel):
 class DaoProposalCreate(DaoProposalBase):
     """Schema for creating a DAO proposal."""
     created_by_user_id: int
-    start_at: Optional[datetime] = None
-    end_at: Optional[datetime] = None
+    start_at: Optional[NaiveUtcDatetime] = None
+    end_at: Optional[NaiveUtcDatetime] = None
 
 
 class DaoProposalRead(BaseModel):
@@ -253,7 +290,8 @@ class DaoProposalRead(BaseModel):
     proposal_type: str
     options_json: list[str]
     min_quorum_percent: float
-    status: str  # "draft", "active", "closed"
+    # "draft", "active", "closed", "approved"; derived from the dates on read
+    status: str = Field(validation_alias=AliasChoices("current_status", "status"))
     start_at: Optional[datetime]
     end_at: Optional[datetime]
     created_by_user_id: int
@@ -292,6 +330,11 @@ class DaoProposalResult(BaseModel):
     status: str
 
 
+class DaoProposalReadWithResults(DaoProposalRead):
+    """Schema for a DAO proposal, optionally with its voting results."""
+    voting_results: Optional[DaoProposalResult] = None
+
+
 # ==================== Marketplace Schemas ====================
 
 class MarketplaceListingCreate(BaseModel):
@@ -1,23 +1,26 @@
 """
 Business logic services for the real estate tokenization platform.
 """
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 import math
 import logging
 from fastapi import HTTPException
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models import User, Property, Investment, UserPropertyBalance
+from app.db import AsyncSessionLocal
+from app.models import User, Property, Investment, UserPropertyBalance, ChainTransaction
 from app.schemas import (
     UserCreate, PropertyCreate, InvestmentCreate, 
     UserPropertyBalanceRead, PortfolioSummaryRead,
     InvestmentResponse, PaginatedPropertiesResponse
 )
 from app.config import settings
-from app.blockchain.wallets import generate_new_wallet, fund_wallet_with_gas
+from app.blockchain.wallets import generate_new_wallet_async, submit_fund_wallet_with_gas
+from app.blockchain.client import confirmation_queue
+from app.blockchain.transactions import is_transaction_known
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +93,123 @@ async def list_users(db: AsyncSession) -> list[User]:
     return list(result.scalars().all())
 
 
+async def track_chain_transaction(db: AsyncSession, tx_hash: str, kind: str) -> ChainTransaction:
+    """
+    Record a submitted transaction and queue it for background confirmation.
+    
+    Args:
+        db: Database session
+        tx_hash: Transaction hash returned by a submit_* function
+        kind: Short label for the operation (e.g. "mint_to_user")
+        
+    Returns:
+        Created ChainTransaction instance with status "submitted"
+    """
+    chain_tx = ChainTransaction(tx_hash=tx_hash, kind=kind, status="submitted")
+    db.add(chain_tx)
+    await db.commit()
+    
+    confirmation_queue.submit(tx_hash, _record_confirmation, _record_timeout)
+    return chain_tx
+
+
+async def _record_confirmation(tx_hash, receipt) -> None:
+    """Flip a tracked transaction to confirmed/failed once it is mined."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(ChainTransaction).where(ChainTransaction.tx_hash == tx_hash.hex())
+        )
+        chain_tx = result.scalar_one_or_none()
+        if not chain_tx:
+            return
+        
+        chain_tx.status = "confirmed" if receipt['status'] == 1 else "failed"
+        chain_tx.block_number = receipt['blockNumber']
+        await db.commit()
+    
+    logger.info("Transaction %s %s in block %s", tx_hash.hex(), chain_tx.status, chain_tx.block_number)
+
+
+async def _record_timeout(tx_hash) -> None:
+    """
+    Settle a tracked transaction whose receipt wait gave up: dropped if
+    the node no longer knows it (it can never be mined), else timed_out.
+    """
+    try:
+        known = await is_transaction_known(tx_hash)
+    except Exception as e:
+        logger.warning("Could not look up timed out transaction %s: %s", tx_hash.hex(), e)
+        known = True
+    
+    status = "timed_out" if known else "dropped"
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(ChainTransaction)
+            .where(
+                ChainTransaction.tx_hash == tx_hash.hex(),
+                ChainTransaction.status.in_(("submitted", "timed_out"))
+            )
+            .values(status=status, updated_at=datetime.utcnow())
+        )
+        await db.commit()
+    
+    if not known:
+        logger.warning("Transaction %s was dropped by the node", tx_hash.hex())
+
+
+async def resume_pending_chain_transactions() -> None:
+    """
+    Re-queue transactions still submitted or timed out (e.g. after a
+    restart); a timed out transaction may still have been mined since.
+    
+    Ones submitted more than CHAIN_TX_RESUME_MAX_AGE_SECONDS ago are
+    marked dropped instead, so a transaction that is never mined is not
+    waited on again on every startup.
+    """
+    pending = ChainTransaction.status.in_(("submitted", "timed_out"))
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.CHAIN_TX_RESUME_MAX_AGE_SECONDS)
+    async with AsyncSessionLocal() as db:
+        dropped = await db.execute(
+            update(ChainTransaction)
+            .where(pending, ChainTransaction.created_at < cutoff)
+            .values(status="dropped", updated_at=datetime.utcnow())
+        )
+        result = await db.execute(select(ChainTransaction.tx_hash).where(pending))
+        tx_hashes = list(result.scalars().all())
+        await db.commit()
+    
+    if dropped.rowcount:
+        logger.warning("Marked %s stale pending transactions dropped", dropped.rowcount)
+    for tx_hash in tx_hashes:
+        confirmation_queue.submit(tx_hash, _record_confirmation, _record_timeout)
+    if tx_hashes:
+        logger.info("Resumed confirmation of %s pending transactions", len(tx_hashes))
+
+
+async def get_chain_transaction(db: AsyncSession, tx_hash: str) -> ChainTransaction:
+    """
+    Get a tracked transaction by hash.
+    
+    Args:
+        db: Database session
+        tx_hash: Transaction hash (with or without 0x prefix)
+        
+    Returns:
+        ChainTransaction instance
+        
+    Raises:
+        HTTPException: If the transaction is not tracked
+    """
+    tx_hash = tx_hash[2:] if tx_hash.startswith("0x") else tx_hash
+    result = await db.execute(
+        select(ChainTransaction).where(ChainTransaction.tx_hash == tx_hash.lower())
+    )
+    chain_tx = result.scalar_one_or_none()
+    if not chain_tx:
+        raise HTTPException(status_code=404, detail="Transaction not found")
+    return chain_tx
+
+
 async def ensure_user_wallet(db: AsyncSession, user: User) -> User:
     """
     Ensure user has a blockchain wallet. Creates one if not exists.
@@ -108,7 +228,7 @@ async def ensure_user_wallet(db: AsyncSession, user: User) -> User:
     
     # Generate new wallet
     logger.info(f"Generating blockchain wallet for user {user.id}")
-    wallet = generate_new_wallet()
+    wallet = await generate_new_wallet_async()
     
     # Update user
     user.blockchain_address = wallet["address"]
@@ -119,10 +239,11 @@ async def ensure_user_wallet(db: AsyncSession, user: User) -> User:
     
     logger.info(f"✅ Wallet created for user {user.id}: {wallet['address']}")
     
-    # Fund wallet with ETH for gas fees
+    # Fund wallet with ETH for gas fees (confirmed in the background)
     try:
-        tx_hash = await fund_wallet_with_gas(wallet["address"], amount_eth=0.1)
-        logger.info(f"✅ Funded wallet {wallet['address']} with 0.1 ETH for gas: {tx_hash}")
+        tx_hash = await submit_fund_wallet_with_gas(wallet["address"], amount_eth=0.1)
+        await track_chain_transaction(db, tx_hash, "fund_wallet")
+        logger.info(f"✅ Sent 0.1 ETH for gas to wallet {wallet['address']}: {tx_hash}")
     except Exception as e:
         logger.warning(f"⚠️ Failed to fund wallet {wallet['address']} with gas: {e}")
         # Don't fail user creation if gas funding fails